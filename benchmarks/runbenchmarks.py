@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+"""
+Benchmarks for the parler_rest serializers.
+
+This measures the number of queries, the wall time and the peak memory
+of the common serializer operations, using the ``testproj`` models.
+The results are written as JSON, so they can be compared across releases::
+
+    ./benchmarks/runbenchmarks.py --output results.json
+    ./benchmarks/runbenchmarks.py --rows 10 100 --languages 1 5 --benchmark serialize_translated_fields
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+module_root = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, module_root)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+import parler  # noqa: E402
+import rest_framework  # noqa: E402
+from django.conf import settings  # noqa: E402
+from django.core.management import call_command  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+
+import parler_rest  # noqa: E402
+from parler_rest.serializers import (  # noqa: E402
+    TranslatableModelSerializer,
+    TranslatedField,
+    TranslatedFieldsField,
+)
+from testproj.models import Country, Picture  # noqa: E402
+
+DEFAULT_ROWS = [10, 100, 1000, 10000]
+DEFAULT_LANGUAGES = [1, 10, 50]
+
+
+class CountryBenchmarkSerializer(TranslatableModelSerializer):
+    translations = TranslatedFieldsField(shared_model=Country)
+
+    class Meta:
+        model = Country
+        fields = ('pk', 'country_code', 'translations')
+
+
+class PictureCaptionBenchmarkSerializer(TranslatableModelSerializer):
+    caption = TranslatedField()
+
+    class Meta:
+        model = Picture
+        fields = ('pk', 'image_nr', 'caption')
+
+
+class PictureBenchmarkSerializer(TranslatableModelSerializer):
+    translations = TranslatedFieldsField(shared_model=Picture)
+
+    class Meta:
+        model = Picture
+        fields = ('pk', 'image_nr', 'translations')
+
+
+class PictureBulkBenchmarkSerializer(PictureBenchmarkSerializer):
+    class Meta(PictureBenchmarkSerializer.Meta):
+        bulk_save_translations = True
+
+
+def create_objects(rows, languages):
+    """
+    Fill the database with a fresh set of countries and pictures.
+    """
+    for model in (Country, Picture):
+        model._parler_meta.root_model.objects.all().delete()
+        model.objects.all().delete()
+
+    # SQLite doesn't enforce the max_length of the country code.
+    Country.objects.bulk_create(Country(country_code=str(i)) for i in range(rows))
+    Picture.objects.bulk_create(Picture(image_nr=i) for i in range(rows))
+
+    Country._parler_meta.root_model.objects.bulk_create(
+        Country._parler_meta.root_model(
+            master_id=pk, language_code=lang, name="Country {0}".format(pk), url="https://example.com/{0}/".format(pk)
+        )
+        for pk in Country.objects.values_list('pk', flat=True)
+        for lang in languages
+    )
+    Picture._parler_meta.root_model.objects.bulk_create(
+        Picture._parler_meta.root_model(master_id=pk, language_code=lang, caption="Picture {0}".format(pk))
+        for pk in Picture.objects.values_list('pk', flat=True)
+        for lang in languages
+    )
+
+
+def get_picture_data(pictures, languages):
+    return [
+        {
+            'image_nr': picture.image_nr,
+            'translations': {lang: {'caption': "Caption {0}".format(picture.pk)} for lang in languages},
+        }
+        for picture in pictures
+    ]
+
+
+# Each benchmark receives the languages, and returns the function to measure.
+# This allows to prepare the data outside the measurement.
+
+def serialize_translated_fields(languages):
+    queryset = CountryBenchmarkSerializer.setup_eager_loading(Country.objects.order_by('pk'))
+    return lambda: CountryBenchmarkSerializer(queryset.all(), many=True).data
+
+
+def serialize_translated_field(languages):
+    queryset = PictureCaptionBenchmarkSerializer.setup_eager_loading(Picture.objects.order_by('pk'))
+    return lambda: PictureCaptionBenchmarkSerializer(queryset.all(), many=True).data
+
+
+def validate(languages):
+    data = get_picture_data(Picture.objects.order_by('pk'), languages)
+
+    def run():
+        serializer = PictureBenchmarkSerializer(data=data, many=True)
+        serializer.is_valid(raise_exception=True)
+
+    return run
+
+
+def _save_translations(serializer_class, languages):
+    pictures = list(PictureBenchmarkSerializer.setup_eager_loading(Picture.objects.order_by('pk')))
+    serializers = []
+    for picture, data in zip(pictures, get_picture_data(pictures, languages)):
+        serializer = serializer_class(picture, data=data)
+        serializer.is_valid(raise_exception=True)
+        serializers.append(serializer)
+
+    def run():
+        for serializer in serializers:
+            serializer.save()
+
+    return run
+
+
+def save_translations(languages):
+    return _save_translations(PictureBenchmarkSerializer, languages)
+
+
+def save_translations_bulk(languages):
+    return _save_translations(PictureBulkBenchmarkSerializer, languages)
+
+
+BENCHMARKS = {
+    'serialize_translated_fields': serialize_translated_fields,
+    'serialize_translated_field': serialize_translated_field,
+    'validate': validate,
+    'save_translations': save_translations,
+    'save_translations_bulk': save_translations_bulk,
+}
+
+
+def measure(benchmark, rows, languages, repeat):
+    """
+    Run a single benchmark, and return the measurements.
+    """
+    # The benchmarks that save data start from the same state each time.
+    times = []
+    for _ in range(repeat):
+        create_objects(rows, languages)
+        func = benchmark(languages)
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+
+    # Tracing slows down the code, so the memory is measured in a separate run.
+    create_objects(rows, languages)
+    func = benchmark(languages)
+    tracemalloc.start()
+    try:
+        func()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'queries': len(queries),
+        'time': min(times),
+        'times': times,
+        'peak_memory': peak_memory,
+    }
+
+
+def get_environment():
+    return {
+        'created': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'djangorestframework': rest_framework.VERSION,
+        'django-parler': parler.__version__,
+        'django-parler-rest': parler_rest.__version__,
+        'database': connection.vendor,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the parler_rest benchmarks.")
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_ROWS, help="Number of objects")
+    parser.add_argument('--languages', type=int, nargs='+', default=DEFAULT_LANGUAGES, help="Number of languages")
+    parser.add_argument('--benchmark', nargs='+', choices=sorted(BENCHMARKS), help="Benchmarks to run (default: all)")
+    parser.add_argument('--repeat', type=int, default=3, help="Number of timed runs, the fastest is reported")
+    parser.add_argument('--output', help="File to write the JSON results to (default: stdout)")
+    options = parser.parse_args(argv)
+
+    all_languages = [code for code, name in settings.LANGUAGES]
+    if max(options.languages) > len(all_languages):
+        parser.error("At most {0} languages are available".format(len(all_languages)))
+
+    call_command('migrate', verbosity=0)
+
+    results = []
+    for name in options.benchmark or BENCHMARKS:
+        for rows in options.rows:
+            for num_languages in options.languages:
+                result = measure(BENCHMARKS[name], rows, all_languages[:num_languages], options.repeat)
+                results.append(dict(benchmark=name, rows=rows, languages=num_languages, **result))
+                sys.stderr.write(
+                    "{0:<30} rows={1:<6} languages={2:<3} queries={queries:<6} time={time:.4f}s "
+                    "peak_memory={peak_memory}\n".format(name, rows, num_languages, **result)
+                )
+
+    output = json.dumps({'environment': get_environment(), 'results': results}, indent=2)
+    if options.output:
+        with open(options.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        sys.stdout.write(output + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,22 @@
+"""
+Django settings for the benchmarks.
+
+These extend the ``testproj`` settings with an in-memory database
+and enough languages to measure the cost of many translations.
+"""
+
+from django.conf.global_settings import LANGUAGES as ALL_LANGUAGES
+
+from testproj.settings import *  # noqa: F401,F403
+
+DEBUG = False
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+LANGUAGES = ALL_LANGUAGES[:50]
+LANGUAGE_CODE = LANGUAGES[0][0]
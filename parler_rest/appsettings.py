@@ -0,0 +1,16 @@
+"""
+Overview of all settings which can be customized.
+"""
+from django.conf import settings
+
+# The query parameter that selects the output languages, e.g. "languages" for ?languages=en,de
+PARLER_REST_LANGUAGES_QUERY_PARAM = getattr(settings, 'PARLER_REST_LANGUAGES_QUERY_PARAM', None)
+
+# The query parameter that selects the translated fields, e.g. "translated_fields" for ?translated_fields=name
+PARLER_REST_TRANSLATED_FIELDS_QUERY_PARAM = getattr(settings, 'PARLER_REST_TRANSLATED_FIELDS_QUERY_PARAM', None)
+
+# The number of language and field selections that Meta.representation_cache stores per object
+PARLER_REST_REPRESENTATION_CACHE_MAX_VARIANTS = getattr(settings, 'PARLER_REST_REPRESENTATION_CACHE_MAX_VARIANTS', 10)
+
+# The instrumentation hook that receives the timings of the translated fields, e.g. "myproject.metrics.Instrumentation"
+PARLER_REST_INSTRUMENTATION = getattr(settings, 'PARLER_REST_INSTRUMENTATION', None)
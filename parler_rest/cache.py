@@ -0,0 +1,129 @@
+"""
+Caching of serialized values that are expensive to generate.
+
+The values are cached per object, in a Django cache backend.
+They are removed when the object or one of it's translations is saved or deleted,
+and again when the transaction is committed.
+"""
+from functools import partial
+
+from django.core.cache import caches
+from django.db import router, transaction
+from django.db.models.signals import post_delete, post_save
+from parler import signals as parler_signals
+from parler.models import TranslatableModelMixin
+
+URL_CACHE = 'url'
+REPRESENTATION_CACHE = 'repr'
+
+_registered_caches = set()
+
+
+def get_object_cache_key(kind, model, pk):
+    """
+    Return the cache key that holds the cached values of an object.
+    """
+    return 'parler_rest.{0}.{1}.{2}'.format(kind, model._meta.concrete_model._meta.label_lower, pk)
+
+
+def get_cached_objects(cache_alias, kind, model, pks):
+    """
+    Return the cached values of several objects, as dict by primary key.
+    """
+    keys = {get_object_cache_key(kind, model, pk): pk for pk in pks}
+    return {keys[key]: value for key, value in caches[cache_alias].get_many(list(keys)).items()}
+
+
+def get_cached_object(cache_alias, kind, model, pk):
+    """
+    Return the cached value of an object, or ``None``.
+    """
+    return caches[cache_alias].get(get_object_cache_key(kind, model, pk))
+
+
+def set_cached_object(cache_alias, kind, model, pk, value):
+    """
+    Store the cached value of an object.
+    """
+    caches[cache_alias].set(get_object_cache_key(kind, model, pk), value)
+
+
+def register_cache(cache_alias, kind):
+    """
+    Register a cache that holds values of the given kind,
+    so these are invalidated when objects are saved.
+    """
+    if not _registered_caches:
+        post_save.connect(_invalidate_shared_object, dispatch_uid='parler_rest.cache.post_save')
+        post_delete.connect(_invalidate_shared_object, dispatch_uid='parler_rest.cache.post_delete')
+        parler_signals.post_translation_save.connect(
+            _invalidate_translation, dispatch_uid='parler_rest.cache.post_translation_save'
+        )
+        parler_signals.post_translation_delete.connect(
+            _invalidate_translation, dispatch_uid='parler_rest.cache.post_translation_delete'
+        )
+    _registered_caches.add((cache_alias, kind))
+
+
+def invalidate_cached_objects(shared_model, pks, using=None):
+    """
+    Remove the cached values of the given objects.
+
+    This is called automatically when a model or translation is saved,
+    but code that bypasses the ``post_save`` signal should call this.
+
+    Inside a transaction, the values are removed again when it's committed,
+    as other processes can cache the old values until the changes are visible to them.
+
+    :param shared_model: The shared model.
+    :type shared_model: :class:`parler.models.TranslatableModel`
+    :param using: The database alias of the transaction, defaults to the database for writes.
+    """
+    pks = list(pks)
+    _delete_cached_objects(shared_model, pks)
+
+    if using is None:
+        using = router.db_for_write(shared_model)
+    if transaction.get_connection(using).in_atomic_block:
+        transaction.on_commit(partial(_delete_cached_objects, shared_model, pks), using=using)
+
+
+def _delete_cached_objects(shared_model, pks):
+    for cache_alias, kind in _registered_caches:
+        if kind == URL_CACHE:
+            # The URLs are stored per translations model.
+            keys = [get_object_cache_key(kind, meta.model, pk) for meta in shared_model._parler_meta for pk in pks]
+        else:
+            keys = [get_object_cache_key(kind, shared_model, pk) for pk in pks]
+        caches[cache_alias].delete_many(keys)
+
+
+def _invalidate_shared_object(sender, instance, **kwargs):
+    if isinstance(instance, TranslatableModelMixin) and instance.pk is not None:
+        invalidate_cached_objects(instance.__class__, [instance.pk], using=kwargs.get('using'))
+
+
+def _invalidate_translation(sender, instance, **kwargs):
+    # Parler sends the shared model as sender.
+    invalidate_cached_objects(sender, [instance.master_id], using=kwargs.get('using'))
+
+
+def get_cached_absolute_urls(cache_alias, translations_model, master_id):
+    """
+    Return a dict with the cached URL path for each language.
+    """
+    return get_cached_object(cache_alias, URL_CACHE, translations_model, master_id) or {}
+
+
+def set_cached_absolute_urls(cache_alias, translations_model, master_id, urls):
+    """
+    Store the URL path for each language of an object.
+    """
+    set_cached_object(cache_alias, URL_CACHE, translations_model, master_id, urls)
+
+
+def register_url_cache(cache_alias):
+    """
+    Register a cache that holds absolute URLs, so it's invalidated when objects are saved.
+    """
+    register_cache(cache_alias, URL_CACHE)
@@ -1,21 +1,216 @@
 """
 Custom serializer fields for nested translations.
 """
-from collections import OrderedDict
+from collections import defaultdict
+from operator import attrgetter, itemgetter
 from django.core.exceptions import ImproperlyConfigured
+from django.utils.encoding import iri_to_uri
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import serializers
+from rest_framework.exceptions import ErrorDetail
 from rest_framework.fields import SkipField
+from rest_framework.validators import UniqueValidator
 from parler.models import TranslatableModelMixin, TranslatedFieldsModel
 from parler.utils.context import switch_language
 
-from parler_rest.utils import create_translated_fields_serializer
+from parler_rest.cache import get_cached_absolute_urls, register_url_cache, set_cached_absolute_urls
+from parler_rest.instrumentation import instrumented
+from parler_rest.utils import (
+    create_translated_fields_serializer,
+    get_prefetched_translations,
+    get_requested_language_choices,
+    get_requested_languages,
+    get_requested_translated_fields,
+)
+
+
+#: Serializer fields that return the model value as-is, these can be read directly.
+PLAIN_FIELD_TYPES = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.EmailField,
+    serializers.FloatField,
+    serializers.IntegerField,
+    serializers.ReadOnlyField,
+    serializers.SlugField,
+    serializers.URLField,
+)
+
+
+def compile_plain_getter(serializer, getter_class=attrgetter, field_names=None, allowed_sources=None):
+    """
+    Create a function that reads the values of the serializer fields directly from an object.
+    This bypasses the ``get_attribute()`` and ``to_representation()`` calls for each field.
+    Pass ``getter_class=itemgetter`` to read from the dicts that ``QuerySet.values()`` returns,
+    and ``field_names`` to only read a selection of the fields.
+    Pass ``allowed_sources`` to only accept fields that read one of these attributes,
+    e.g. the columns that a ``values()`` query selected.
+
+    Returns ``None`` when the serializer has any fields that need their own logic,
+    e.g. a custom field, a :class:`TranslatedAbsoluteUrlField`, or a field that reads
+    a method or property of the model, as DRF calls these.
+    """
+    if type(serializer).to_representation is not serializers.Serializer.to_representation:
+        return None
+
+    model = getattr(getattr(serializer, 'Meta', None), 'model', None)
+    if model is None:
+        return None
+    column_names = set(field.attname for field in model._meta.concrete_fields)
+
+    names = []
+    sources = []
+    for field in serializer._readable_fields:
+        if field_names is not None and field.field_name not in field_names:
+            continue
+
+        # Exact type checks, as subclasses may have their own logic.
+        if type(field) not in PLAIN_FIELD_TYPES or field.source not in column_names:
+            return None
+        if allowed_sources is not None and field.source not in allowed_sources:
+            return None
+        names.append(field.field_name)
+        sources.append(field.source)
+
+    if not sources:
+        return None
+
+    getter = getter_class(*sources)
+    if len(sources) == 1:
+        name = names[0]
+        return lambda obj: {name: getter(obj)}
+    else:
+        return lambda obj: dict(zip(names, getter(obj)))
+
+
+def get_translation_projection(field):
+    """
+    Return the ``(languages, translated_fields)`` that are selected for the output,
+    see :func:`~parler_rest.utils.get_requested_languages`. This is determined once per field.
+    """
+    try:
+        return field._translation_projection
+    except AttributeError:
+        pass
+
+    translated_fields = get_requested_translated_fields(field.context)
+    projection = (
+        get_requested_languages(field.context),
+        frozenset(translated_fields) if translated_fields else None,
+    )
+    field._translation_projection = projection
+    return projection
+
+
+def get_single_language_choices(field):
+    """
+    Return the language and it's fallbacks for a field with ``single_language=True``,
+    limited to the selected languages. This is determined once per field.
+    """
+    try:
+        return field._single_language_choices
+    except AttributeError:
+        pass
+
+    languages, translated_fields = get_translation_projection(field)
+    choices = [
+        lang_code for lang_code in get_requested_language_choices(field.context)
+        if not languages or lang_code in languages
+    ]
+    field._single_language_choices = choices
+    return choices
+
+
+def pick_language(values, language_choices):
+    """
+    Return the value of the first available language, or ``None``.
+    """
+    for lang_code in language_choices:
+        if lang_code in values:
+            return values[lang_code]
+    return None
+
+
+def collect_translated_attributes(serializer, instance, related_name, fields, languages=None):
+    """
+    Read several translated fields in all languages, with a single pass over the translations.
+
+    :param fields: A list of ``(field_name, source)`` tuples.
+    :param languages: Optional list of languages to include.
+    :returns: A dict with a dictionary per language for each field name.
+    """
+    result = {field_name: {} for field_name, source in fields}
+
+    translations = get_translation_values(serializer, instance, related_name)
+    if translations is not None:
+        read = dict.__getitem__
+    else:
+        translations = get_prefetched_translations(
+            instance, related_name, languages=get_translation_projection(serializer)[0]
+        )
+        if translations is None:
+            translations = getattr(instance, related_name).all()
+        read = getattr
+
+    for translation in translations:
+        language_code = read(translation, 'language_code')
+        if languages and language_code not in languages:
+            continue
+        for field_name, source in fields:
+            result[field_name][language_code] = read(translation, source)
+    return result
+
+
+def pop_unique_validators(serializer):
+    """
+    Remove the :class:`~rest_framework.validators.UniqueValidator` objects from the serializer fields,
+    so these checks can be performed for all languages at once.
+
+    Only the validators that check the translations model of the serializer are removed,
+    others remain on the field. Returns a list of ``(field, validator)`` tuples.
+    """
+    model = getattr(getattr(serializer, 'Meta', None), 'model', None)
+    unique_validators = []
+    for field in serializer._writable_fields:
+        validators = []
+        for validator in field.validators:
+            # Exact type check, as subclasses may have their own logic.
+            if (type(validator) is UniqueValidator and validator.lookup == 'exact'
+                    and model is not None and validator.queryset.model is model):
+                unique_validators.append((field, validator))
+            else:
+                validators.append(validator)
+        field.validators = validators
+    return unique_validators
+
+
+def get_translation_values(serializer, instance, related_name):
+    """
+    Return the translations that the :class:`~parler_rest.serializers.TranslatableListSerializer`
+    loaded as ``values()`` rows for the given object, or ``None`` when these are not available.
+    """
+    list_serializer = getattr(serializer, 'parent', None)
+    translation_values = getattr(list_serializer, 'translation_values', None)
+    if translation_values is None or related_name not in translation_values:
+        return None
+    return translation_values[related_name].get(instance.pk, ())
 
 
 class TranslatedFieldsField(serializers.Field):
     """
     Exposing all translated fields for a TranslatableModel in REST style.
+
+    With ``fast=True``, translation serializers that only have plain model fields
+    are serialized by reading the attributes directly.
+
+    With ``single_language=True``, only the fields of the active language (or ``context['language']``)
+    are exposed, or those of the fallback language when it's not translated.
+    The fallback is resolved from the prefetched translations.
+
+    With ``replace=True``, the received languages replace all existing translations,
+    so languages that are missing in the data are deleted when the object is saved.
+    Partial updates (e.g. ``PATCH``) only update the received languages.
     """
     default_error_messages = dict(serializers.Field.default_error_messages, **{
         'invalid': _("Input is not a valid dict"),
@@ -30,6 +225,16 @@ class TranslatedFieldsField(serializers.Field):
         self.shared_model = kwargs.pop('shared_model', None)
 
         self.allow_empty = kwargs.pop('allow_empty', False)
+        self.fast = kwargs.pop('fast', False)
+        self.single_language = kwargs.pop('single_language', False)
+        self.replace = kwargs.pop('replace', False)
+        if self.replace and self.single_language:
+            raise ImproperlyConfigured("TranslatedFieldsField(replace=True) can't be used with single_language=True")
+        self.plain_getter = None
+        self.values_getter = None
+        self.values_sources = None
+        self._validation_serializer = None
+        self._unique_validators = None
         super(TranslatedFieldsField, self).__init__(*args, **kwargs)
 
     def bind(self, field_name, parent):
@@ -38,6 +243,7 @@ class TranslatedFieldsField(serializers.Field):
 
         Takes translatable model class (shared_model) from parent serializer and it
         may create a serializer class on the fly if no custom class was specified.
+        The translation serializer is instantiated here, so it's shared by all rows.
         """
         super(TranslatedFieldsField, self).bind(field_name, parent)
 
@@ -47,9 +253,30 @@ class TranslatedFieldsField(serializers.Field):
 
         # This could all be done in __init__(), but by moving the code here,
         # it's possible to auto-detect the parent model.
-        if self.shared_model is not None and self.serializer_class is not None:
-            return
+        if self.shared_model is None or self.serializer_class is None:
+            self._fill_serializer_class(related_name, parent)
+
+        # Only need one serializer to create the native objects.
+        # It's bound once, and reused for all objects and languages the parent serializer handles.
+        self.translation_serializer = self.serializer_class(partial=getattr(parent, 'partial', False))
+        self.translation_serializer.bind(field_name='', parent=self)
+
+        # Don't need to have a 'language_code', it will be split up already,
+        # so this should avoid redundant output.
+        if 'language_code' in self.translation_serializer.fields:
+            raise ImproperlyConfigured("Serializer may not have a 'language_code' field")
+
+        if self.fast:
+            self.plain_getter = compile_plain_getter(self.translation_serializer)
+
+        # For the rows that TranslatableListSerializer loads with context['translation_values'],
+        # these only contain the translated columns.
+        self.values_sources = frozenset(self.serializer_class.Meta.model.get_translated_fields(include_m2m=False))
+        self.values_getter = compile_plain_getter(
+            self.translation_serializer, getter_class=itemgetter, allowed_sources=self.values_sources
+        )
 
+    def _fill_serializer_class(self, related_name, parent):
         # Fill in the blanks
         if self.serializer_class is None:
             if self.shared_model is None:
@@ -76,6 +303,7 @@ class TranslatedFieldsField(serializers.Field):
             #translated_fields_model = self.serializer_class.Meta.model
             #self.shared_model = translated_fields_model.master.field.related.model
 
+    @instrumented('to_representation')
     def to_representation(self, value):
         """
         Serialize translated fields.
@@ -84,35 +312,86 @@ class TranslatedFieldsField(serializers.Field):
         delegate serialization logic to the translation model serializer.
 
         Output languages can be selected by passing a list of language codes,
-        `languages`, within the serialization context.
+        `languages`, within the serialization context. Translations that are
+        loaded with ``prefetch_related()`` are filtered without extra queries.
         """
         if value is None:
             return
 
-        # Only need one serializer to create the native objects
-        serializer = self.serializer_class(
-            instance=self.parent.instance,  # Typically None
-            context=self.context,
-            partial=self.parent.partial
-        )
+        languages, translated_fields, plain_getter, values_getter = self._get_output_plan()
+        if self.single_language:
+            languages = get_single_language_choices(self)
 
-        # Don't need to have a 'language_code', it will be split up already,
-        # so this should avoid redundant output.
-        if 'language_code' in serializer.fields:
-            raise ImproperlyConfigured("Serializer may not have a 'language_code' field")
+        rows = None
+        if values_getter is not None:
+            rows = get_translation_values(self.parent, value.instance, self.source)
 
-        translations = value.all()  # value = translations related manager
-        languages = self.context.get('languages')
-        if languages:
-            translations = translations.filter(language_code__in=languages)
+        if rows is not None:
+            result = {
+                row['language_code']: values_getter(row) for row in rows
+                if not languages or row['language_code'] in languages
+            }
+        else:
+            result = self._translations_to_representation(value, languages, translated_fields, plain_getter)
+
+        if self.single_language:
+            return pick_language(result, languages)
+        return result
+
+    def _translations_to_representation(self, value, languages, translated_fields, plain_getter):
+        # value = translations related manager
+        prefetched = get_prefetched_translations(
+            value.instance, self.source, languages=get_translation_projection(self)[0]
+        )
+        if prefetched is not None:
+            translations = prefetched
+            if languages:
+                # Filter in Python, calling filter() would discard the prefetch_related() results.
+                translations = [t for t in translations if t.language_code in languages]
+        else:
+            translations = value.all()
+            if languages:
+                translations = translations.filter(language_code__in=languages)
 
         # Split into a dictionary per language
-        result = OrderedDict()
-        for translation in translations:
-            result[translation.language_code] = serializer.to_representation(translation)
+        result = {}
+        if plain_getter is not None:
+            for translation in translations:
+                result[translation.language_code] = plain_getter(translation)
+        else:
+            to_native = self.translation_serializer.to_representation
+            for translation in translations:
+                data = to_native(translation)
+                if translated_fields is not None:
+                    data = {key: data[key] for key in data if key in translated_fields}
+                result[translation.language_code] = data
 
         return result
 
+    def _get_output_plan(self):
+        # Determine once per field how the output is generated, as the context is the same for all rows.
+        try:
+            return self._output_plan
+        except AttributeError:
+            pass
+
+        languages, translated_fields = get_translation_projection(self)
+        if translated_fields is None:
+            plain_getter = self.plain_getter
+            values_getter = self.values_getter
+        else:
+            plain_getter = None
+            if self.fast:
+                plain_getter = compile_plain_getter(self.translation_serializer, field_names=translated_fields)
+            values_getter = compile_plain_getter(
+                self.translation_serializer, getter_class=itemgetter, field_names=translated_fields,
+                allowed_sources=self.values_sources
+            )
+
+        self._output_plan = (languages, translated_fields, plain_getter, values_getter)
+        return self._output_plan
+
+    @instrumented('to_internal_value')
     def to_internal_value(self, data):
         """
         Deserialize data from translations fields.
@@ -125,55 +404,148 @@ class TranslatedFieldsField(serializers.Field):
 
         if not isinstance(data, dict):
             self.fail('invalid')
+        if self.single_language:
+            data = {get_requested_language_choices(self.context)[0]: data}
         if not self.allow_empty and len(data) == 0:
             self.fail('empty')
 
+        # The same serializer validates all languages, so it's fields are only constructed once.
+        serializer = self.get_validation_serializer()
+
         result, errors = {}, {}
         for lang_code, model_fields in data.items():
-            serializer = self.serializer_class(data=model_fields)
-            if serializer.is_valid():
-                result[lang_code] = serializer.validated_data
-            else:
-                errors[lang_code] = serializer.errors
+            try:
+                result[lang_code] = serializer.run_validation(model_fields)
+            except serializers.ValidationError as e:
+                errors[lang_code] = e.detail
+
+        if self._unique_validators:
+            self._run_unique_validators(result, errors)
 
         if errors:
             raise serializers.ValidationError(errors)
         return result
 
+    def get_validation_serializer(self):
+        """
+        Return the serializer that validates the data of each language.
+        """
+        if self._validation_serializer is None:
+            serializer = self.serializer_class(context=self.context)
+            self._unique_validators = pop_unique_validators(serializer)
+            self._validation_serializer = serializer
+        return self._validation_serializer
+
+    def _run_unique_validators(self, result, errors):
+        """
+        Perform the unique checks for all languages with a single query per field.
+        """
+        # When updating an object, it's own translations are no conflict.
+        instance = getattr(self.parent, 'instance', None)
+        master_id = instance.pk if isinstance(instance, TranslatableModelMixin) else None
+
+        for field, validator in self._unique_validators:
+            field_name = field.source_attrs[-1]
+            values = {
+                lang_code: validated_data[field_name] for lang_code, validated_data in result.items()
+                if field_name in validated_data
+            }
+            if not values:
+                continue
+
+            queryset = validator.queryset.filter(**{'{0}__in'.format(field_name): set(values.values())})
+            existing = defaultdict(set)
+            for value, row_master_id, row_lang_code in queryset.values_list(field_name, 'master_id', 'language_code'):
+                existing[value].add((row_master_id, row_lang_code))
+
+            for lang_code, value in values.items():
+                # The translation that is updated is no conflict for itself.
+                if existing[value] - {(master_id, lang_code)}:
+                    lang_errors = errors.setdefault(lang_code, {})
+                    lang_errors.setdefault(field.field_name, []).append(
+                        ErrorDetail(str(validator.message), code='unique')
+                    )
+
 
 class TranslatedField(serializers.Field):
     """
     Read-only field to expose a single object property in all it's languages.
+
+    With ``single_language=True``, only the value of the active language (or ``context['language']``)
+    is exposed, or the value of the fallback language when it's not translated.
+    The fallback is resolved from the prefetched translations.
     """
 
+    related_name = None
+
+    def __init__(self, *args, **kwargs):
+        self.single_language = kwargs.pop('single_language', False)
+        super(TranslatedField, self).__init__(*args, **kwargs)
+
+    def bind(self, field_name, parent):
+        super(TranslatedField, self).bind(field_name, parent)
+
+        # Resolve the translations relation once, when the parent serializer tells the model.
+        model = getattr(getattr(parent, 'Meta', None), 'model', None)
+        if getattr(model, '_parler_meta', None) is not None:
+            # This already validates the fields existance
+            self.related_name = model._parler_meta._get_extension_by_field(self.source).rel_name
+
+    @instrumented('get_attribute')
     def get_attribute(self, instance):
-        # Instead of fetching the attribute with getattr() (that proxies to the Parler TranslatableField),
-        # read the translation model directly to fetch all languages, and combine that into a dict.
-        model = instance._parler_meta.get_model_by_field(self.source)  # This already validates the fields existance
-        extension = instance._parler_meta[model]
-        translations = getattr(instance, extension.rel_name)
+        languages, translated_fields = get_translation_projection(self)
+        if translated_fields is not None and self.field_name not in translated_fields:
+            raise SkipField()
 
-        # Split into a dictionary per language
-        value = OrderedDict()
-        for translation in translations.all():  # Allow prefetch_related() to do it's work
-            value[translation.language_code] = getattr(translation, self.source)
-        return value
+        # The TranslatableModelSerializer collects all translated fields in a single pass.
+        if self.single_language:
+            languages = get_single_language_choices(self)
+
+        collected = getattr(self.parent, '_translated_attributes', None)
+        if collected is not None and collected[0] is instance:
+            values = collected[1][self.field_name]
+        else:
+            # Instead of fetching the attribute with getattr() (that proxies to the Parler TranslatableField),
+            # read the translation model directly to fetch all languages, and combine that into a dict.
+            related_name = self.related_name or instance._parler_meta._get_extension_by_field(self.source).rel_name
+            fields = [(self.field_name, self.source)]
+            values = collect_translated_attributes(
+                self.parent, instance, related_name, fields, languages=languages
+            )[self.field_name]
+
+        if self.single_language:
+            return pick_language(values, languages)
+        return values
 
     def to_representation(self, value):
         return value
 
     # pylint: disable=no-self-use
     def to_internal_value(self, data):
+        if self.single_language:
+            return {get_requested_language_choices(self.context)[0]: data}
         return data
 
 
 class TranslatedAbsoluteUrlField(serializers.ReadOnlyField):
     """
     Allow adding an absolute URL to a given translation.
+
+    With ``cache='default'``, the URL paths are stored in the given Django cache,
+    so ``get_absolute_url()`` is only called when the object or it's translations changed.
     """
+
+    def __init__(self, *args, **kwargs):
+        self.cache = kwargs.pop('cache', None)
+        self._cached_urls = {}
+        self._url_prefix = None
+        super(TranslatedAbsoluteUrlField, self).__init__(*args, **kwargs)
+        if self.cache:
+            register_url_cache(self.cache)
+
     def get_attribute(self, instance):
         # When handling the create() all, skip this field.
-        if isinstance(instance, (dict, OrderedDict)):
+        if isinstance(instance, dict):
             raise SkipField()
 
         assert isinstance(instance, TranslatedFieldsModel), (
@@ -185,5 +557,36 @@ class TranslatedAbsoluteUrlField(serializers.ReadOnlyField):
 
     def to_representation(self, value):
         request = self.context['request']
+        if self.cache:
+            path = self._get_cached_path(value)
+        else:
+            path = self._get_path(value)
+
+        # Resolve the scheme and host once per request, and only append the path.
+        # This gives the same result as request.build_absolute_uri() does for absolute paths.
+        if path.startswith('/') and not path.startswith('//') and '/./' not in path and '/../' not in path:
+            if self._url_prefix is None or self._url_prefix[0] is not request:
+                self._url_prefix = (request, request.build_absolute_uri('/')[:-1])
+            return self._url_prefix[1] + path
+        return request.build_absolute_uri(path)
+
+    def _get_path(self, value):
         with switch_language(value.master, value.language_code):
-            return request.build_absolute_uri(value.master.get_absolute_url())
+            return iri_to_uri(value.master.get_absolute_url())
+
+    def _get_cached_path(self, value):
+        translations_model = value.__class__
+        key = (translations_model, value.master_id)
+        try:
+            urls = self._cached_urls[key]
+        except KeyError:
+            urls = get_cached_absolute_urls(self.cache, translations_model, value.master_id)
+            self._cached_urls[key] = urls
+
+        try:
+            return urls[value.language_code]
+        except KeyError:
+            path = self._get_path(value)
+            urls[value.language_code] = path
+            set_cached_absolute_urls(self.cache, translations_model, value.master_id, urls)
+            return path
@@ -0,0 +1,200 @@
+"""
+Optional instrumentation of the translation serialization.
+
+When enabled, each call to the instrumented methods is timed, and reported
+as a :class:`Measurement` to the ``record()`` method of a hook object.
+This can be enabled with the ``PARLER_REST_INSTRUMENTATION`` setting::
+
+    PARLER_REST_INSTRUMENTATION = 'myproject.metrics.StatsdInstrumentation'
+
+or at runtime, using :func:`set_instrumentation` or :func:`instrumentation`.
+The timing wrappers are only installed on the classes while a hook is active,
+so the instrumentation has no overhead when it's disabled.
+"""
+import time
+from contextlib import ExitStack, contextmanager
+from functools import wraps
+
+from django.db import connections
+from django.utils.module_loading import import_string
+
+from parler_rest import appsettings
+from parler_rest.utils import get_requested_languages
+
+_hook = None
+_instrumented_methods = []
+
+
+class Measurement(object):
+    """
+    The details of a single call to an instrumented method.
+    The ``rows`` are the number of objects the call handled, this is 1 for the fields of a single object.
+    """
+
+    __slots__ = ('operation', 'field', 'field_name', 'duration', 'rows', 'languages', 'queries')
+
+    def __init__(self, operation, field, duration, rows, languages, queries):
+        self.operation = operation
+        self.field = field
+        self.field_name = get_field_path(field)
+        self.duration = duration
+        self.rows = rows
+        self.languages = languages
+        self.queries = queries
+
+    def __repr__(self):
+        return "<Measurement: {0} {1} {2:.6f}s, {3} rows, {4} languages, {5} queries>".format(
+            self.operation, self.field_name, self.duration, self.rows, self.languages, self.queries
+        )
+
+
+class Instrumentation(object):
+    """
+    Base class for the instrumentation hooks.
+    Override :meth:`record` to export the measurements, e.g. to a metrics system.
+    """
+
+    def record(self, measurement):
+        """
+        Receive the :class:`Measurement` of a call to an instrumented method.
+        """
+        pass
+
+
+def get_instrumentation():
+    """
+    Return the active instrumentation hook, or ``None`` when it's disabled.
+    """
+    return _hook
+
+
+def set_instrumentation(hook):
+    """
+    Activate an instrumentation hook, or disable the instrumentation by passing ``None``.
+    """
+    global _hook
+    _hook = hook
+    for owner, name, func, wrapper in _instrumented_methods:
+        setattr(owner, name, func if hook is None else wrapper)
+
+
+@contextmanager
+def instrumentation(hook):
+    """
+    Activate an instrumentation hook while the block runs.
+    """
+    previous = _hook
+    set_instrumentation(hook)
+    try:
+        yield hook
+    finally:
+        set_instrumentation(previous)
+
+
+def count_single_row(field, result, *args, **kwargs):
+    """
+    Return the number of rows for a method that handles a single object.
+    """
+    return 1
+
+
+def count_result_rows(serializer, result, *args, **kwargs):
+    """
+    Return the number of objects in the result of a list serializer.
+    """
+    return len(result)
+
+
+def count_requested_languages(serializer, result, *args, **kwargs):
+    """
+    Return the number of selected languages, or 0 when all languages are included.
+    """
+    return len(get_requested_languages(serializer.context) or ())
+
+
+def count_result_languages(field, result, *args, **kwargs):
+    """
+    Return the number of languages in a result that has a key per language.
+    """
+    if getattr(field, 'single_language', False):
+        return 0 if result is None else 1
+    return len(result) if result else 0
+
+
+def count_data_languages(serializer, result, instance, translated_data):
+    """
+    Return the number of languages in the translated data, that has a dict per language for each field.
+    """
+    return len(set(lang_code for values in translated_data.values() for lang_code in values))
+
+
+def instrumented(operation, count_languages=count_result_languages, count_rows=count_single_row):
+    """
+    Decorate a field or serializer method, so it's calls are measured when the instrumentation is enabled.
+    The class holds the original method until a hook is activated.
+
+    :param operation: The operation name, reported in :attr:`Measurement.operation`.
+    :param count_languages: Function that returns the number of languages,
+        given the field, the result and the method arguments.
+    :param count_rows: Function that returns the number of objects, with the same arguments.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if _hook is None:
+                return func(self, *args, **kwargs)
+
+            hook = _hook
+            queries = [0]
+
+            def count_queries(execute, sql, params, many, context):
+                queries[0] += 1
+                return execute(sql, params, many, context)
+
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(count_queries))
+                start = time.perf_counter()
+                result = func(self, *args, **kwargs)
+                duration = time.perf_counter() - start
+
+            languages = count_languages(self, result, *args, **kwargs)
+            rows = count_rows(self, result, *args, **kwargs)
+            hook.record(Measurement(operation, self, duration, rows, languages, queries[0]))
+            return result
+
+        return _InstrumentedMethod(func, wrapper)
+
+    return decorator
+
+
+class _InstrumentedMethod(object):
+    # Placeholder in the class body, which registers the method once the class is created.
+
+    def __init__(self, func, wrapper):
+        self.func = func
+        self.wrapper = wrapper
+
+    def __set_name__(self, owner, name):
+        _instrumented_methods.append((owner, name, self.func, self.wrapper))
+        setattr(owner, name, self.func if _hook is None else self.wrapper)
+
+
+def get_field_path(field):
+    """
+    Return the dotted path of a field, from the root serializer.
+    """
+    names = []
+    while field is not None:
+        if field.field_name:
+            names.append(field.field_name)
+        field = field.parent
+    return ".".join(reversed(names))
+
+
+def _load_hook():
+    if appsettings.PARLER_REST_INSTRUMENTATION:
+        set_instrumentation(import_string(appsettings.PARLER_REST_INSTRUMENTATION)())
+
+
+_load_hook()
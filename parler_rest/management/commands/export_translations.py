@@ -0,0 +1,138 @@
+"""
+Export all objects of a translatable serializer as NDJSON, using multiple processes.
+"""
+import multiprocessing
+import os
+import shutil
+import tempfile
+
+import django
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.utils.module_loading import import_string
+
+from parler_rest.serializers import TranslatableModelSerializerMixin
+from parler_rest.streaming import iter_ndjson
+
+
+class Command(BaseCommand):
+    help = (
+        "Export all objects of a TranslatableModelSerializer as newline delimited JSON. "
+        "The table is split into primary key ranges, that are serialized by separate worker processes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('serializer', help="Dotted path to the serializer class, e.g. myapp.serializers.CountrySerializer")
+        parser.add_argument('output', help="The output file, or the directory for the shards when --shards is used")
+        parser.add_argument(
+            '--workers', type=int, default=os.cpu_count() or 1,
+            help="Number of worker processes (default: the number of CPU cores)"
+        )
+        parser.add_argument(
+            '--range-size', type=int, default=10000,
+            help="Number of objects that a worker exports at once (default: 10000)"
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, default=2000,
+            help="Number of objects that are fetched with their translations at once (default: 2000)"
+        )
+        parser.add_argument('--languages', help="Comma separated list of languages to export")
+        parser.add_argument(
+            '--shards', action='store_true',
+            help="Write a separate file for each range into the output directory, instead of a merged file"
+        )
+
+    def handle(self, *args, **options):
+        try:
+            serializer_class = import_string(options['serializer'])
+        except ImportError as e:
+            raise CommandError(str(e))
+        if not issubclass(serializer_class, TranslatableModelSerializerMixin):
+            raise CommandError("{0} is not a TranslatableModelSerializer".format(options['serializer']))
+        if options['workers'] < 1 or options['range_size'] < 1 or options['chunk_size'] < 1:
+            raise CommandError("The --workers, --range-size and --chunk-size should be at least 1")
+
+        context = {}
+        if options['languages']:
+            context['languages'] = [code.strip() for code in options['languages'].split(',') if code.strip()]
+
+        output = options['output']
+        if options['shards']:
+            os.makedirs(output, exist_ok=True)
+            shard_dir = output
+        else:
+            shard_dir = tempfile.mkdtemp(prefix='.export-', dir=os.path.dirname(os.path.abspath(output)))
+
+        pk_ranges = get_pk_ranges(serializer_class.Meta.model, options['range_size'])
+        tasks = [
+            (options['serializer'], first_pk, last_pk, options['chunk_size'], context,
+             os.path.join(shard_dir, 'part-{0:05d}.ndjson'.format(i)))
+            for i, (first_pk, last_pk) in enumerate(pk_ranges)
+        ]
+
+        try:
+            results = self.run_tasks(tasks, options['workers'])
+            if not options['shards']:
+                with open(output, 'wb') as merged:
+                    for shard, count in results:
+                        with open(shard, 'rb') as f:
+                            shutil.copyfileobj(f, merged)
+        finally:
+            if not options['shards']:
+                shutil.rmtree(shard_dir, ignore_errors=True)
+
+        self.stdout.write("Exported {0} objects in {1} ranges to {2}".format(
+            sum(count for shard, count in results), len(results), output
+        ))
+
+    def run_tasks(self, tasks, workers):
+        if workers == 1 or len(tasks) <= 1:
+            return [export_range(task) for task in tasks]
+
+        # Don't share the database connections with the worker processes.
+        connections.close_all()
+        with multiprocessing.Pool(min(workers, len(tasks)), initializer=_init_worker) as pool:
+            return pool.map(export_range, tasks, chunksize=1)
+
+
+def get_pk_ranges(model, range_size):
+    """
+    Split the table into ``(first_pk, last_pk)`` ranges of ``range_size`` objects.
+    """
+    pks = model._default_manager.order_by('pk').values_list('pk', flat=True)
+    ranges = []
+    first_pk = last_pk = None
+    for i, pk in enumerate(pks.iterator()):
+        if i % range_size == 0:
+            if first_pk is not None:
+                ranges.append((first_pk, last_pk))
+            first_pk = pk
+        last_pk = pk
+    if first_pk is not None:
+        ranges.append((first_pk, last_pk))
+    return ranges
+
+
+def export_range(task):
+    """
+    Write the objects of a primary key range as NDJSON to a shard file.
+    This runs in the worker processes.
+    """
+    serializer_path, first_pk, last_pk, chunk_size, context, shard = task
+    serializer_class = import_string(serializer_path)
+    queryset = serializer_class.Meta.model._default_manager.filter(pk__gte=first_pk, pk__lte=last_pk).order_by('pk')
+    serializer = serializer_class(queryset, many=True, context=context)
+
+    count = 0
+    with open(shard, 'w', encoding='utf-8') as f:
+        for line in iter_ndjson(serializer.iter_representation(chunk_size=chunk_size)):
+            f.write(line)
+            count += 1
+    return shard, count
+
+
+def _init_worker():
+    # Processes that are spawned instead of forked need to load Django first.
+    if not apps.ready:
+        django.setup()
@@ -1,10 +1,334 @@
 """
 Custom serializers suitable to translated models.
 """
+import warnings
+from collections import defaultdict
+from itertools import islice
+
+from django.conf import settings
+from django.db import connections, models, router, transaction
+from django.db.models import prefetch_related_objects
 from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
 
 # Similar to DRF itself, expose all fields in the same manner.
 from parler_rest.fields import TranslatedFieldsField, TranslatedField, TranslatedAbsoluteUrlField  # noqa
+from parler_rest import appsettings
+from parler_rest.cache import (
+    REPRESENTATION_CACHE,
+    get_cached_object,
+    get_cached_objects,
+    register_cache,
+    set_cached_object,
+)
+from parler_rest.fields import collect_translated_attributes, get_translation_projection
+from parler_rest.instrumentation import (
+    count_data_languages,
+    count_requested_languages,
+    count_result_rows,
+    instrumented,
+)
+from parler_rest.utils import (
+    aiterate_queryset,
+    aprefetch_related_objects,
+    bulk_save_translations,
+    can_return_rows_from_bulk_insert,
+    clear_prefetched_translations,
+    clear_translations_cache,
+    delete_other_translations,
+    get_parler_meta_by_source,
+    get_modified_translated_fields,
+    get_prefetched_translations,
+    get_requested_language_choices,
+    get_requested_languages,
+    get_requested_translated_fields,
+    get_translations_prefetch,
+    load_translations,
+)
+
+# The arguments that DRF only passes to the list serializer, not the child.
+LIST_SERIALIZER_KWARGS_REMOVE = getattr(
+    serializers, 'LIST_SERIALIZER_KWARGS_REMOVE', ('allow_empty', 'max_length', 'min_length')  # DRF < 3.15
+)
+
+
+class TranslatableListSerializer(serializers.ListSerializer):
+    """
+    List serializer that is used for ``many=True`` by :class:`TranslatableModelSerializerMixin`.
+
+    In ``DEBUG`` mode, it warns when the translations were not prefetched,
+    as each object would perform its own query to fetch the translations.
+
+    When ``context['translation_values']`` is set, the translations of all objects are
+    fetched in a single ``values()`` query per translations model. The translated fields
+    read these rows directly, so no translation model instances are constructed.
+    This only applies to read-only usage, and translation serializers with plain model fields.
+    Translations that other fields need (e.g. a method of the translation model) are prefetched instead.
+
+    When the child serializer has a ``Meta.representation_cache``, the cached representations
+    of all objects are read at once, and translations are only loaded for the other objects.
+
+    Use :meth:`iter_representation` to serialize a large queryset in chunks.
+    """
+    translation_values = None
+    cached_representations = None
+
+    @instrumented('list_to_representation', count_languages=count_requested_languages, count_rows=count_result_rows)
+    def to_representation(self, data):
+        use_values = self._use_translation_values()
+        cache_alias = self.child.get_representation_cache()
+        if settings.DEBUG or use_values or cache_alias:
+            iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+            data = list(iterable)
+            self._load_translations(data, prefetch=bool(cache_alias))
+        return super(TranslatableListSerializer, self).to_representation(data)
+
+    def iter_representation(self, chunk_size=2000):
+        """
+        Yield the representation of each object, without building the complete list in memory.
+
+        A queryset is read in chunks using ``iterator()``, and the translations
+        are prefetched for each chunk. The ``prefetch_related()`` lookups
+        of the queryset are also performed per chunk.
+        See :mod:`parler_rest.streaming` to send the output as a streaming response.
+        """
+        data = self.instance
+        if isinstance(data, models.manager.BaseManager):
+            data = data.all()
+
+        lookups = ()
+        if isinstance(data, models.QuerySet):
+            lookups = data._prefetch_related_lookups
+            data = data.prefetch_related(None).iterator(chunk_size=chunk_size)
+
+        iterator = iter(data)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return
+            if lookups:
+                prefetch_related_objects(chunk, *lookups)
+            for item in self._chunk_to_representation(chunk):
+                yield item
+
+    @instrumented('list_to_representation', count_languages=count_requested_languages, count_rows=count_result_rows)
+    def _chunk_to_representation(self, chunk):
+        self._load_translations(chunk, prefetch=True)
+        return [self.child.to_representation(item) for item in chunk]
+
+    async def ato_representation(self, data):
+        """
+        Async version of :meth:`to_representation`, for async views.
+
+        The objects and their translations are loaded with the async ORM,
+        after which the representation is generated without further queries.
+        """
+        if isinstance(data, models.manager.BaseManager):
+            data = data.all()
+        if isinstance(data, models.QuerySet):
+            data = await aiterate_queryset(data)
+        else:
+            data = list(data)
+
+        objects = data
+        cache_alias = self.child.get_representation_cache()
+        if cache_alias:
+            objects = self._load_cached_representations(cache_alias, data)
+
+        prefetches = self._get_translations_prefetches()
+        if self._use_translation_values():
+            self.translation_values = await self._aload_translation_values(objects)
+        await aprefetch_related_objects(objects, *prefetches)
+        return super(TranslatableListSerializer, self).to_representation(data)
+
+    def _load_translations(self, objects, prefetch=False):
+        # Prepare the translations for the objects that will be serialized.
+        cache_alias = self.child.get_representation_cache()
+        if cache_alias:
+            objects = self._load_cached_representations(cache_alias, objects)
+
+        if self._use_translation_values():
+            self.translation_values = self._load_translation_values(objects)
+            # The relations that can't be read from the values() rows are still prefetched.
+            prefetch = True
+        if prefetch:
+            # Objects that already have their translations prefetched are skipped.
+            prefetch_related_objects(objects, *self._get_translations_prefetches())
+        elif settings.DEBUG:
+            self._check_translations_prefetched(objects)
+
+    def _use_translation_values(self):
+        # Lists that are nested in another list read the translations that the outer list prefetched.
+        if not self.context.get('translation_values'):
+            return False
+        parent = self.parent
+        while parent is not None:
+            if isinstance(parent, serializers.ListSerializer):
+                return False
+            parent = parent.parent
+        return True
+
+    def _get_translations_prefetches(self):
+        languages = get_requested_languages(self.context)
+        prefetches = self.child.get_translations_prefetches(languages=languages)
+        if self._use_translation_values():
+            values_names = self._get_values_related_names()
+            prefetches = [prefetch for prefetch in prefetches if prefetch.prefetch_through not in values_names]
+        return prefetches
+
+    def _get_values_related_names(self):
+        # The relations that are only read by fields that support the values() rows.
+        # Fields that read the model attributes, or translation serializers with
+        # other fields (e.g. a method or the 'id') need the translation model instances.
+        meta_by_source = get_parler_meta_by_source(self.child.Meta.model)
+        excluded = set()
+        for field in self.child._readable_fields:
+            if isinstance(field, TranslatedFieldsField):
+                if field.values_getter is None:
+                    excluded.add(meta_by_source[field.source].rel_name)
+            elif not isinstance(field, TranslatedField) and field.source_attrs:
+                meta = meta_by_source.get(field.source_attrs[0])
+                if meta is not None:
+                    excluded.add(meta.rel_name)
+
+        return [
+            related_name for related_name in self.child.get_translated_related_names()
+            if related_name not in excluded
+        ]
+
+    def _load_cached_representations(self, cache_alias, objects):
+        # Read the cache for all objects at once, return the objects that are not cached.
+        variant = self.child.get_representation_cache_variant()
+        self.cached_representations = get_cached_objects(
+            cache_alias, REPRESENTATION_CACHE, self.child.Meta.model, [obj.pk for obj in objects]
+        )
+        return [
+            obj for obj in objects
+            if variant not in self.cached_representations.get(obj.pk, ())
+        ]
+
+    def create(self, validated_data):
+        """
+        Create all objects and their translations in a single transaction.
+        By default, each object is saved with the ``create()`` and ``save_translations()``
+        methods of the child serializer.
+
+        When the child serializer sets ``Meta.bulk_create = True``, all objects are created with
+        ``bulk_create()``, and the translations of all objects are inserted using a single query
+        per translations model. Like ``bulk_create()`` itself, this doesn't call the ``save()``
+        method of the model, and doesn't send the ``pre_save`` and ``post_save`` signals.
+        Objects are still created one by one when the ``create()`` or ``save_translations()``
+        method of the child serializer is overwritten, when the database can't return
+        the primary keys of bulk inserted rows, or when many-to-many fields are given.
+        """
+        model = self.child.Meta.model
+        using = router.db_for_write(model)
+        translated_data = [self.child._pop_translated_data(attrs) for attrs in validated_data]
+
+        with transaction.atomic(using=using):
+            if not self._can_bulk_create(model, validated_data, using):
+                instances = [self.child.create(attrs) for attrs in validated_data]
+                for instance, translations in zip(instances, translated_data):
+                    self.child.save_translations(instance, translations)
+                return instances
+
+            for attrs in validated_data:
+                serializers.raise_errors_on_nested_writes('create', self.child, attrs)
+            instances = model._default_manager.using(using).bulk_create([model(**attrs) for attrs in validated_data])
+            bulk_save_translations(
+                model,
+                [
+                    (instance, self.child._split_translated_data(translations))
+                    for instance, translations in zip(instances, translated_data)
+                ],
+                send_signals=getattr(self.child.Meta, 'send_translation_signals', False),
+                check_existing=False,
+            )
+        return instances
+
+    def _can_bulk_create(self, model, validated_data, using):
+        if not getattr(self.child.Meta, 'bulk_create', False):
+            return False
+        if type(self.child).create is not serializers.ModelSerializer.create or \
+                type(self.child).save_translations is not TranslatableModelSerializerMixin.save_translations:
+            return False  # Keep the custom logic of the serializer
+        if not can_return_rows_from_bulk_insert(connections[using]) or model._meta.parents:
+            return False
+
+        many_to_many = set(field.name for field in model._meta.many_to_many)
+        return not any(many_to_many.intersection(attrs) for attrs in validated_data)
+
+    def _load_translation_values(self, objects):
+        translation_values = {}
+        for related_name, queryset in self._get_translation_values_querysets(objects):
+            rows_by_master = defaultdict(list)
+            for row in queryset:
+                rows_by_master[row['master_id']].append(row)
+            translation_values[related_name] = rows_by_master
+        return translation_values
+
+    async def _aload_translation_values(self, objects):
+        translation_values = {}
+        for related_name, queryset in self._get_translation_values_querysets(objects):
+            rows_by_master = defaultdict(list)
+            for row in await aiterate_queryset(queryset):
+                rows_by_master[row['master_id']].append(row)
+            translation_values[related_name] = rows_by_master
+        return translation_values
+
+    def _get_translation_values_querysets(self, objects):
+        pks = [obj.pk for obj in objects]
+        parler_meta = self.child.Meta.model._parler_meta
+        languages = get_requested_languages(self.context)
+        translated_fields = get_requested_translated_fields(self.context)
+        if translated_fields:
+            translated_sources = self._get_translated_sources(translated_fields)
+
+        querysets = []
+        for related_name in self._get_values_related_names():
+            meta = parler_meta[related_name]
+            queryset = meta.model._default_manager.filter(master_id__in=pks)
+            if languages:
+                queryset = queryset.filter(language_code__in=languages)
+
+            # Only read the columns that are part of the output
+            fields = meta.get_translated_fields(include_m2m=False)
+            if translated_fields:
+                fields = [name for name in fields if name in translated_sources]
+
+            querysets.append((related_name, queryset.values('master_id', 'language_code', *fields)))
+        return querysets
+
+    def _get_translated_sources(self, translated_fields):
+        # The selection uses the output field names, the values() query needs the model fields they read.
+        sources = set()
+        for field in self.child._readable_fields:
+            if isinstance(field, TranslatedFieldsField):
+                sources.update(
+                    translated_field.source for translated_field in field.translation_serializer._readable_fields
+                    if translated_field.field_name in translated_fields
+                )
+            elif isinstance(field, TranslatedField) and field.field_name in translated_fields:
+                sources.add(field.source)
+        return sources
+
+    def _check_translations_prefetched(self, objects):
+        if len(objects) <= 1 or not isinstance(objects[0], models.Model):
+            return
+
+        languages = get_requested_languages(self.context)
+        missing = [
+            related_name for related_name in self.child.get_translated_related_names()
+            if get_prefetched_translations(objects[0], related_name, languages=languages) is None
+        ]
+        if missing:
+            warnings.warn(
+                "{0} serializes a list of {1} objects without prefetching '{2}'. "
+                "Use {0}.setup_eager_loading() to avoid a query for each object.".format(
+                    self.child.__class__.__name__, objects[0].__class__.__name__, "', '".join(missing)
+                ),
+                RuntimeWarning,
+            )
 
 
 class TranslatableModelSerializerMixin(object):
@@ -12,6 +336,211 @@ class TranslatableModelSerializerMixin(object):
     Mixin class to be added to a :class:`rest_framework.serializers.ModelSerializer` .
     """
 
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        """
+        Use the :class:`TranslatableListSerializer` for ``many=True``,
+        unless the ``Meta.list_serializer_class`` was configured.
+        """
+        if hasattr(getattr(cls, 'Meta', None), 'list_serializer_class'):
+            return super(TranslatableModelSerializerMixin, cls).many_init(*args, **kwargs)
+
+        # The same as DRF does, with a different default for Meta.list_serializer_class
+        list_kwargs = {}
+        for key in LIST_SERIALIZER_KWARGS_REMOVE:
+            value = kwargs.pop(key, None)
+            if value is not None:
+                list_kwargs[key] = value
+        list_kwargs['child'] = cls(*args, **kwargs)
+        list_kwargs.update({
+            key: value for key, value in kwargs.items()
+            if key in serializers.LIST_SERIALIZER_KWARGS
+        })
+        return TranslatableListSerializer(*args, **list_kwargs)
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, context=None):
+        """
+        Prefetch all translations that the serializer needs, including those of nested serializers.
+        When languages are selected (e.g. ``context['languages']``), only those will be fetched::
+
+            queryset = CountrySerializer.setup_eager_loading(Country.objects.all())
+
+        For write requests (e.g. ``PUT``), all languages are prefetched,
+        so saving the translations can reuse these as well.
+        """
+        context = context or {}
+        languages = None
+        request = context.get('request')
+        if request is None or request.method in SAFE_METHODS:
+            languages = get_requested_languages(context)
+        return queryset.prefetch_related(*cls.get_translations_prefetches(languages=languages))
+
+    @classmethod
+    def get_translations_prefetches(cls, languages=None, prefix=''):
+        """
+        Return the :class:`~django.db.models.Prefetch` objects for all translations the serializer reads.
+        """
+        shared_model = cls.Meta.model
+        prefetches = [
+            get_translations_prefetch(shared_model, related_name, languages=languages, prefix=prefix)
+            for related_name in cls.get_translated_related_names()
+        ]
+
+        for field_name, field in cls._declared_fields.items():
+            # Nested serializers, either with or without many=True
+            serializer = getattr(field, 'child', field)
+            source = field.source or field_name
+            if isinstance(serializer, TranslatableModelSerializerMixin) and source != '*':
+                prefetches.extend(serializer.get_translations_prefetches(
+                    languages=languages, prefix='{0}{1}__'.format(prefix, source.replace('.', '__'))
+                ))
+        return prefetches
+
+    @classmethod
+    def get_translated_related_names(cls):
+        """
+        Tell which translation relations are accessed by the fields of this serializer.
+        """
+        parler_meta = cls.Meta.model._parler_meta
+        meta_fields = getattr(cls.Meta, 'fields', None)
+        field_names = set()
+        if isinstance(meta_fields, (list, tuple)):
+            # Translated fields that ModelSerializer reads via the model attribute.
+            field_names.update(name for name in meta_fields if name not in cls._declared_fields)
+
+        for field_name, field in cls._declared_fields.items():
+            if isinstance(field, TranslatedFieldsField):
+                field_names.add(parler_meta._get_extension_by_related_name(field.source or field_name).rel_name)
+            elif isinstance(field, TranslatedField):
+                field_names.add(field.source or field_name)
+
+        # Return the names in the order of the extensions, which is stable.
+        return [
+            meta.rel_name for meta in parler_meta
+            if meta.rel_name in field_names or field_names.intersection(meta.get_translated_fields())
+        ]
+
+    def __init_subclass__(cls, **kwargs):
+        super(TranslatableModelSerializerMixin, cls).__init_subclass__(**kwargs)
+
+        # Register the cache early, so saving objects invalidates it, also in other processes.
+        cache_alias = getattr(getattr(cls, 'Meta', None), 'representation_cache', None)
+        if cache_alias:
+            register_cache(cache_alias, REPRESENTATION_CACHE)
+
+    def get_representation_cache(self):
+        """
+        Return the Django cache alias that stores the representations, if ``Meta.representation_cache`` is set.
+        """
+        return getattr(self.Meta, 'representation_cache', None)
+
+    def get_representation_cache_variant(self):
+        """
+        Return the key that distinguishes the cached representations of an object.
+        This includes the serializer class, the selected languages and translated fields,
+        and the active language when a field uses ``single_language=True``.
+        """
+        try:
+            return self._representation_cache_variant
+        except AttributeError:
+            pass
+
+        languages = get_requested_languages(self.context)
+        translated_fields = get_requested_translated_fields(self.context)
+        variant = '{0}.{1}|{2}|{3}'.format(
+            self.__class__.__module__, self.__class__.__qualname__,
+            ','.join(sorted(set(languages))) if languages else '',
+            ','.join(sorted(set(translated_fields))) if translated_fields else '',
+        )
+        if any(getattr(field, 'single_language', False) for field in self._readable_fields):
+            # The output depends on the active language.
+            variant += '|' + ','.join(get_requested_language_choices(self.context))
+
+        self._representation_cache_variant = variant
+        return variant
+
+    def to_representation(self, instance):
+        """
+        Return the representation of the object.
+
+        When ``Meta.representation_cache`` is set, the representation is cached,
+        until the object or it's translations are saved. Hence it should only
+        depend on the object itself, and the selected languages and fields.
+        Output that depends on the request, like the host of a :class:`TranslatedAbsoluteUrlField`,
+        is not part of the :meth:`get_representation_cache_variant`.
+        At most ``PARLER_REST_REPRESENTATION_CACHE_MAX_VARIANTS`` selections are stored per object.
+        """
+        cache_alias = self.get_representation_cache()
+        if not cache_alias or getattr(instance, 'pk', None) is None:
+            return self._to_representation(instance)
+
+        variant = self.get_representation_cache_variant()
+        list_cache = getattr(self.parent, 'cached_representations', None)
+        if list_cache is not None:
+            variants = list_cache.get(instance.pk)
+        else:
+            variants = get_cached_object(cache_alias, REPRESENTATION_CACHE, self.Meta.model, instance.pk)
+
+        if variants and variant in variants:
+            return variants[variant]
+
+        data = self._to_representation(instance)
+        variants = dict(variants or {})
+        while variants and len(variants) >= appsettings.PARLER_REST_REPRESENTATION_CACHE_MAX_VARIANTS:
+            # Remove the oldest selection, so the cache entry doesn't grow without limit.
+            del variants[next(iter(variants))]
+        variants[variant] = data
+        set_cached_object(cache_alias, REPRESENTATION_CACHE, self.Meta.model, instance.pk, variants)
+        return data
+
+    async def ato_representation(self, instance):
+        """
+        Async version of :meth:`to_representation`, for async views.
+
+        The translations are loaded with the async ORM (including those of nested serializers),
+        after which the representation is generated without further queries.
+        """
+        languages = get_requested_languages(self.context)
+        await aprefetch_related_objects([instance], *self.get_translations_prefetches(languages=languages))
+        return self.to_representation(instance)
+
+    def _to_representation(self, instance):
+        """
+        Collect the values of all :class:`TranslatedField` fields in a single pass over the translations.
+        """
+        languages, field_groups = self._get_translated_field_groups()
+        if not field_groups:
+            return super(TranslatableModelSerializerMixin, self).to_representation(instance)
+
+        collected = {}
+        for related_name, fields in field_groups.items():
+            collected.update(collect_translated_attributes(self, instance, related_name, fields, languages=languages))
+
+        # The TranslatedField.get_attribute() reads the collected values
+        self._translated_attributes = (instance, collected)
+        try:
+            return super(TranslatableModelSerializerMixin, self).to_representation(instance)
+        finally:
+            self._translated_attributes = None
+
+    def _get_translated_field_groups(self):
+        # Group the TranslatedField fields by their translations relation, once per serializer.
+        try:
+            return self._translated_field_groups
+        except AttributeError:
+            pass
+
+        languages, translated_fields = get_translation_projection(self)
+        field_groups = {}
+        for field in self._readable_fields:
+            if isinstance(field, TranslatedField) and field.related_name is not None:
+                if translated_fields is None or field.field_name in translated_fields:
+                    field_groups.setdefault(field.related_name, []).append((field.field_name, field.source))
+
+        self._translated_field_groups = (languages, field_groups)
+        return self._translated_field_groups
+
     def save(self, **kwargs):
         """
         Extract the translations and save them after main object save.
@@ -25,37 +554,156 @@ class TranslatableModelSerializerMixin(object):
         self.save_translations(instance, translated_data)
         return instance
 
-    def _pop_translated_data(self):
+    def _pop_translated_data(self, validated_data=None):
         """
         Separate data of translated fields from other data.
         """
+        if validated_data is None:
+            validated_data = self.validated_data
+
+        replaced_sources = self._get_replaced_translation_sources()
         translated_data = {}
-        for field_name, field in self.get_fields().items():
-            if isinstance(field, (TranslatedField, TranslatedFieldsField)):
-                key = field.source or field_name
-                translations = self.validated_data.pop(key, None)
-                if translations:
-                    translated_data[key] = translations
+        for key in self.get_translated_field_sources():
+            translations = validated_data.pop(key, None)
+            if translations or (translations is not None and key in replaced_sources):
+                # An empty dict of a replace=True field deletes all languages.
+                translated_data[key] = translations
         return translated_data
 
+    @classmethod
+    def get_translated_field_sources(cls):
+        """
+        Return the sources of the translated fields, with their field class.
+        This is computed once per serializer class.
+        """
+        # Read from the class __dict__, so subclasses don't inherit the value of their parent.
+        try:
+            return cls.__dict__['_translated_field_sources']
+        except KeyError:
+            pass
+
+        sources = {
+            (field.source or field_name): field.__class__
+            for field_name, field in cls._declared_fields.items()
+            if isinstance(field, (TranslatedField, TranslatedFieldsField))
+        }
+        cls._translated_field_sources = sources
+        return sources
+
+    @instrumented('save_translations', count_languages=count_data_languages)
     def save_translations(self, instance, translated_data):
         """
         Save translation data into translation objects.
+
+        The stored translations of the received languages are read with a single query,
+        and only the translations and columns that changed are written.
+
+        When ``Meta.bulk_save_translations`` is set, the translations are written
+        with bulk queries instead, see :func:`~parler_rest.utils.bulk_save_translations`.
+
+        For a :class:`TranslatedFieldsField` with ``replace=True``, the languages that are
+        missing in the data are deleted with a single query per translations model.
+        This happens in the same transaction, and the caches are cleared afterwards.
         """
-        for meta in self.Meta.model._parler_meta:
-            for field_name, translations in translated_data.items():
-                for lang_code, translation in translations.items():
-                    model_field = instance._get_translated_model(lang_code, auto_create=True, meta=meta)
-                    if meta.rel_name == field_name:
-                        for trans_field, value in translation.items():
-                            setattr(model_field, trans_field, value)
-                    elif field_name in meta.get_translated_fields():
-                        setattr(model_field, field_name, translation)
+        split_data = self._split_translated_data(translated_data)
+        replaced_metas = self._get_replaced_translation_metas(translated_data)
+        if not replaced_metas:
+            self._write_translations(instance, split_data)
+            return
+
+        with transaction.atomic(using=router.db_for_write(self.Meta.model, instance=instance)):
+            self._write_translations(instance, split_data)
+            for meta in replaced_metas:
+                delete_other_translations(instance, meta, list(split_data.get(meta, ())))
+        clear_translations_cache(instance, replaced_metas)
+
+    def _get_replaced_translation_sources(self):
+        # The TranslatedFieldsField(replace=True) fields, a partial update (PATCH) never deletes languages.
+        if getattr(self, 'partial', False):
+            return []
+        return [
+            field.source or field_name for field_name, field in self._declared_fields.items()
+            if isinstance(field, TranslatedFieldsField) and field.replace
+        ]
+
+    def _get_replaced_translation_metas(self, translated_data):
+        # The translation models of the received TranslatedFieldsField(replace=True) fields.
+        parler_meta = self.Meta.model._parler_meta
+        metas = []
+        for source in self._get_replaced_translation_sources():
+            if source in translated_data:
+                meta = parler_meta._get_extension_by_related_name(source)
+                if meta not in metas:
+                    metas.append(meta)
+        return metas
+
+    def _write_translations(self, instance, split_data):
+        if getattr(self.Meta, 'bulk_save_translations', False):
+            bulk_save_translations(
+                self.Meta.model, [(instance, split_data)],
+                send_signals=getattr(self.Meta, 'send_translation_signals', False)
+            )
+            return
+
+        # Only touch the translation models that receive data,
+        # so no empty translations are created for the other extensions.
+        for meta, translations in split_data.items():
+            # Fetch the stored translations of all received languages at once
+            load_translations(instance, meta, translations)
+
+            for lang_code, values in translations.items():
+                translation = instance._get_translated_model(lang_code, auto_create=True, meta=meta)
+                for trans_field, value in values.items():
+                    if getattr(translation, trans_field) != value:
+                        setattr(translation, trans_field, value)
+
+                if translation.pk is not None:
+                    # Only update the columns that changed, unchanged translations are not saved at all.
+                    update_fields = get_modified_translated_fields(translation)
+                    if update_fields:
+                        instance.save_translation(translation, update_fields=update_fields)
 
         # Go through the same hooks as the regular model,
         # instead of calling translation.save() directly.
         instance.save_translations()
 
+        # The prefetched translations don't include the changes, the output reads them again.
+        for meta in split_data:
+            clear_prefetched_translations(instance, meta.rel_name)
+
+    async def asave_translations(self, instance, translated_data):
+        """
+        Async version of :meth:`save_translations`.
+
+        The translations are written in a single ``sync_to_async()`` call, as Django's async ORM
+        doesn't support transactions, and runs it's own write queries in a thread as well.
+        """
+        from asgiref.sync import sync_to_async  # Not installed with Django 2.2
+
+        await sync_to_async(self.save_translations)(instance, translated_data)
+
+    def _split_translated_data(self, translated_data):
+        """
+        Reorganize the translated data per translations model and language.
+        """
+        meta_by_source = get_parler_meta_by_source(self.Meta.model)
+        result = {}
+        for source, translations in translated_data.items():
+            meta = meta_by_source.get(source)
+            if meta is None:
+                continue
+
+            meta_translations = result.setdefault(meta, {})
+            if source == meta.rel_name:
+                # TranslatedFieldsField, a dict with all fields per language.
+                for lang_code, values in translations.items():
+                    meta_translations.setdefault(lang_code, {}).update(values)
+            else:
+                # TranslatedField, a single value per language.
+                for lang_code, value in translations.items():
+                    meta_translations.setdefault(lang_code, {})[source] = value
+        return result
+
 
 class TranslatableModelSerializer(TranslatableModelSerializerMixin, serializers.ModelSerializer):
     """
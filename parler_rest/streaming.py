@@ -0,0 +1,56 @@
+"""
+Streaming output of large translated querysets.
+
+The objects are serialized in chunks by :meth:`TranslatableListSerializer.iter_representation()
+<parler_rest.serializers.TranslatableListSerializer.iter_representation>`, and encoded one by one,
+so the memory usage doesn't grow with the size of the table::
+
+    def export_countries(request):
+        serializer = CountrySerializer(Country.objects.all(), many=True, context={'request': request})
+        return get_streaming_response(serializer, format='ndjson')
+"""
+from django.http import StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+
+#: The content types of the supported formats.
+CONTENT_TYPES = {
+    'json': 'application/json',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+def iter_json(rows, encoder_class=JSONEncoder):
+    """
+    Encode the rows as a single JSON list, yielding one row at a time.
+    """
+    encode = encoder_class(ensure_ascii=False).encode
+    yield '['
+    for i, row in enumerate(rows):
+        yield encode(row) if i == 0 else ',' + encode(row)
+    yield ']'
+
+
+def iter_ndjson(rows, encoder_class=JSONEncoder):
+    """
+    Encode the rows as newline delimited JSON, with one line per row.
+    """
+    encode = encoder_class(ensure_ascii=False).encode
+    for row in rows:
+        yield encode(row) + '\n'
+
+
+def get_streaming_response(serializer, format='json', chunk_size=2000, encoder_class=JSONEncoder, **kwargs):
+    """
+    Return a :class:`~django.http.StreamingHttpResponse` with the output of a ``many=True`` serializer.
+
+    :param format: Either ``json`` or ``ndjson``.
+    :param chunk_size: The number of objects that are fetched at once.
+    """
+    if format not in CONTENT_TYPES:
+        raise ValueError("Unsupported format '{0}', use one of: {1}".format(format, ", ".join(sorted(CONTENT_TYPES))))
+
+    rows = serializer.iter_representation(chunk_size=chunk_size)
+    encode = iter_ndjson if format == 'ndjson' else iter_json
+    kwargs.setdefault('content_type', CONTENT_TYPES[format])
+    return StreamingHttpResponse(encode(rows, encoder_class=encoder_class), **kwargs)
+
@@ -0,0 +1,171 @@
+"""
+Helpers to detect translation queries that are performed for each row (the "N+1" problem).
+
+Use :func:`assert_translation_queries_constant` to check a serializer against a queryset,
+or wrap any code with :func:`assert_no_translation_queries_per_row`.
+When pytest is used, the ``translation_queries`` fixture can be enabled in a ``conftest.py``::
+
+    pytest_plugins = ['parler_rest.testing']
+"""
+import sys
+from contextlib import contextmanager
+
+from django.apps import apps
+from django.db import DEFAULT_DB_ALIAS, connections
+from parler.models import TranslatedFieldsModelMixin
+from rest_framework.fields import Field
+
+from parler_rest.fields import collect_translated_attributes
+from parler_rest.instrumentation import get_field_path
+
+try:
+    import pytest
+except ImportError:
+    pytest = None
+
+
+class TranslationQueryLog(object):
+    """
+    The translation queries that were performed, with the serializer field that caused them.
+    Queries that are not caused by a field (e.g. the prefetch of a list) have no field name.
+    """
+
+    def __init__(self):
+        self.queries = []
+        self.rows = None
+
+    def __len__(self):
+        return len(self.queries)
+
+    def add(self, field_name, sql):
+        self.queries.append((field_name, sql))
+
+    def by_field(self):
+        """
+        Return the number of queries per field name.
+        """
+        counts = {}
+        for field_name, sql in self.queries:
+            counts[field_name] = counts.get(field_name, 0) + 1
+        return counts
+
+    def get_repeated_fields(self):
+        """
+        Return the fields that performed more than one query, these likely do so for every row.
+        """
+        return {
+            field_name: count for field_name, count in self.by_field().items()
+            if field_name is not None and count > 1
+        }
+
+    def __str__(self):
+        lines = []
+        for field_name, count in sorted(self.by_field().items(), key=lambda item: item[0] or ''):
+            line = "{0}: {1} queries".format(field_name or "(no field)", count)
+            if self.rows:
+                line += " ({0:.2f} per row)".format(count / self.rows)
+            lines.append(line)
+        return "\n".join(lines)
+
+
+@contextmanager
+def capture_translation_queries(using=DEFAULT_DB_ALIAS):
+    """
+    Record the queries on translation tables, and the serializer field that performed them.
+
+    :rtype: TranslationQueryLog
+    """
+    connection = connections[using]
+    tables = [connection.ops.quote_name(table) for table in _get_translation_tables()]
+    log = TranslationQueryLog()
+
+    def execute_wrapper(execute, sql, params, many, context):
+        if any(table in sql for table in tables):
+            log.add(_get_current_field_name(), sql)
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(execute_wrapper):
+        yield log
+
+
+@contextmanager
+def assert_no_translation_queries_per_row(using=DEFAULT_DB_ALIAS):
+    """
+    Fail when a serializer field performed more than one translation query.
+    """
+    with capture_translation_queries(using=using) as log:
+        yield log
+
+    repeated = log.get_repeated_fields()
+    if repeated:
+        raise AssertionError(
+            "Translation queries are performed per row by: {0}\n{1}".format(", ".join(sorted(repeated)), log)
+        )
+
+
+def assert_translation_queries_constant(serializer_class, queryset, context=None, row_counts=(1, 2),
+                                        using=DEFAULT_DB_ALIAS):
+    """
+    Serialize several slices of the queryset, and fail when the number of translation queries
+    grows with the number of rows. The queryset is used as-is, so it should include the prefetches.
+
+    :returns: The :class:`TranslationQueryLog` of each slice.
+    """
+    logs = []
+    for row_count in row_counts:
+        objects = queryset.all()[:row_count]
+        with capture_translation_queries(using=using) as log:
+            rows = len(serializer_class(objects, many=True, context=context or {}).data)
+        if rows < row_count:
+            raise AssertionError("The queryset needs at least {0} rows, it has {1}".format(row_count, rows))
+        log.rows = rows
+        logs.append(log)
+
+    first, last = logs[0], logs[-1]
+    if len(last) > len(first):
+        first_counts = first.by_field()
+        growing = [
+            field_name or "(no field)" for field_name, count in last.by_field().items()
+            if count > first_counts.get(field_name, 0)
+        ]
+        raise AssertionError(
+            "Translation queries grow from {0} for {1} rows to {2} for {3} rows, caused by: {4}\n{5}".format(
+                len(first), first.rows, len(last), last.rows, ", ".join(sorted(growing)), last
+            )
+        )
+    return logs
+
+
+def _get_translation_tables():
+    return set(
+        model._meta.db_table for model in apps.get_models()
+        if issubclass(model, TranslatedFieldsModelMixin)
+    )
+
+
+def _get_current_field_name():
+    # Find the innermost serializer field in the call stack.
+    frame = sys._getframe(2)
+    while frame is not None:
+        if frame.f_code is collect_translated_attributes.__code__:
+            # The serializer reads several TranslatedField values at once.
+            prefix = get_field_path(frame.f_locals['serializer'])
+            return ", ".join(
+                ".".join(filter(None, [prefix, field_name])) for field_name, source in frame.f_locals['fields']
+            )
+
+        field = frame.f_locals.get('self')
+        if isinstance(field, Field) and field.field_name:
+            return get_field_path(field)
+        frame = frame.f_back
+    return None
+
+
+if pytest is not None:
+    @pytest.fixture
+    def translation_queries():
+        """
+        Fail the test when a serializer field performed translation queries for each row.
+        """
+        with assert_no_translation_queries_per_row() as log:
+            yield log
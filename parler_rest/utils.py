@@ -1,13 +1,39 @@
 """
 Various utilities to ease integration with Rest Framework.
 """
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, router, transaction
+from django.db.models import Prefetch, prefetch_related_objects
+from django.utils.translation import gettext as _
+from parler import appsettings as parler_appsettings
+from parler import signals as parler_signals
+from parler.cache import MISSING, get_translation_cache_key
+from parler.utils.i18n import get_active_language_choices, get_language
 from rest_framework import serializers
 
+from parler_rest import appsettings
+from parler_rest.cache import invalidate_cached_objects
+
+try:
+    from django.db.models import aprefetch_related_objects as _aprefetch_related_objects  # Django 5.2+
+except ImportError:
+    _aprefetch_related_objects = None
+
+_serializer_class_cache = {}
+_parler_meta_by_source_cache = {}
+
 
 def create_translated_fields_serializer(shared_model, meta=None, related_name=None, **fields):
     """
     Create a Rest Framework serializer class for a translated fields model.
 
+    The generated classes are cached, so the same arguments return the same class.
+    This doesn't apply when serializer fields are passed, as these can't be compared.
+    Use :func:`clear_translated_fields_serializer_cache` to reset this cache.
+
     :param shared_model: The shared model.
     :type shared_model: :class:`parler.models.TranslatableModel`
     """
@@ -22,10 +48,496 @@ def create_translated_fields_serializer(shared_model, meta=None, related_name=No
     meta['model'] = translated_model
     meta.setdefault('fields', ['language_code'] + translated_model.get_translated_fields())
 
+    cache_key = None
+    if not fields:
+        cache_key = _get_serializer_cache_key(shared_model, related_name, meta)
+        try:
+            return _serializer_class_cache[cache_key]
+        except (KeyError, TypeError):  # TypeError when the cache key is not hashable
+            pass
+
     # Define serialize class attributes
     attrs = {}
     attrs.update(fields)
     attrs['Meta'] = type('Meta', (), meta)
 
     # Dynamically create the serializer class
-    return type('{0}Serializer'.format(translated_model.__name__), (serializers.ModelSerializer,), attrs)
+    serializer_class = type('{0}Serializer'.format(translated_model.__name__), (serializers.ModelSerializer,), attrs)
+    if cache_key is not None:
+        try:
+            _serializer_class_cache[cache_key] = serializer_class
+        except TypeError:
+            pass
+    return serializer_class
+
+
+def clear_translated_fields_serializer_cache():
+    """
+    Remove all serializer classes that :func:`create_translated_fields_serializer` cached.
+    """
+    _serializer_class_cache.clear()
+
+
+def _get_serializer_cache_key(shared_model, related_name, meta):
+    return (shared_model, related_name or None, _freeze(meta))
+
+
+def _freeze(value):
+    # Turn the arguments into a hashable value.
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    elif isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    else:
+        return value
+
+
+def get_parler_meta_by_source(shared_model):
+    """
+    Return a dict that maps the related names and translated field names of a model
+    to their :class:`~parler.models.ParlerMeta`. The result is computed once per model.
+
+    :param shared_model: The shared model.
+    :type shared_model: :class:`parler.models.TranslatableModel`
+    """
+    try:
+        return _parler_meta_by_source_cache[shared_model]
+    except KeyError:
+        pass
+
+    meta_by_source = {}
+    for meta in shared_model._parler_meta:
+        meta_by_source[meta.rel_name] = meta
+        for field_name in meta.get_translated_fields():
+            meta_by_source[field_name] = meta
+
+    _parler_meta_by_source_cache[shared_model] = meta_by_source
+    return meta_by_source
+
+
+def get_requested_languages(context):
+    """
+    Return the languages to output, either from ``context['languages']``,
+    or the query parameter that ``PARLER_REST_LANGUAGES_QUERY_PARAM`` defines.
+    Returns ``None`` when all languages should be included.
+
+    The languages of the query parameter are validated against the ``LANGUAGES`` setting,
+    and returned in a sorted order without duplicates.
+    """
+    languages = context.get('languages')
+    if languages:
+        return languages
+
+    param = appsettings.PARLER_REST_LANGUAGES_QUERY_PARAM
+    languages = _get_query_param_list(context, param)
+    if not languages:
+        return None
+
+    languages = sorted(set(lang_code.lower() for lang_code in languages))
+    valid_languages = set(lang_code.lower() for lang_code, name in settings.LANGUAGES)
+    invalid = [lang_code for lang_code in languages if lang_code not in valid_languages]
+    if invalid:
+        raise serializers.ValidationError({
+            param: [_("Unknown language: {0}").format(lang_code) for lang_code in invalid]
+        })
+    return languages
+
+
+def get_requested_translated_fields(context):
+    """
+    Return the translated fields to output, either from ``context['translated_fields']``,
+    or the query parameter that ``PARLER_REST_TRANSLATED_FIELDS_QUERY_PARAM`` defines.
+    These are the names of the serializer fields, which may differ from the model fields they read.
+    Returns ``None`` when all fields should be included.
+    """
+    translated_fields = context.get('translated_fields')
+    if translated_fields:
+        return translated_fields
+
+    translated_fields = _get_query_param_list(context, appsettings.PARLER_REST_TRANSLATED_FIELDS_QUERY_PARAM)
+    return sorted(set(translated_fields)) if translated_fields else None
+
+
+def get_requested_language_choices(context):
+    """
+    Return the language and it's fallback languages, for fields that output a single language.
+    The language is read from ``context['language']``, or the currently active language.
+    """
+    return list(get_active_language_choices(context.get('language') or get_language()))
+
+
+def _get_query_param_list(context, param):
+    # Parse a comma separated query parameter, e.g. ?languages=en,de
+    request = context.get('request')
+    if not param or request is None:
+        return None
+
+    query_params = getattr(request, 'query_params', request.GET)
+    value = query_params.get(param)
+    if not value:
+        return None
+    return [item.strip() for item in value.split(',') if item.strip()] or None
+
+
+def get_prefetched_translations(instance, related_name, languages=None):
+    """
+    Return the translations that ``prefetch_related()`` stored for the given relation,
+    or ``None`` when the relation was not prefetched.
+
+    When ``languages`` is given, the translations that :func:`get_translations_prefetch`
+    fetched for exactly these languages are also returned.
+    """
+    try:
+        # Read the cache directly, like django-parler does,
+        # as accessing the QuerySet._prefetch_done flag is more expensive.
+        return instance._prefetched_objects_cache[related_name]
+    except (AttributeError, KeyError):
+        pass
+
+    if languages:
+        return instance.__dict__.get(get_translations_prefetch_attr(related_name, languages))
+    return None
+
+
+def get_translations_prefetch_attr(related_name, languages):
+    """
+    Return the private attribute that holds the translations that are prefetched for a selection of languages.
+    """
+    return '_prefetched_{0}:{1}'.format(related_name, ','.join(sorted(set(languages))))
+
+
+def clear_prefetched_translations(instance, related_name):
+    """
+    Remove the prefetched translations of a relation, including those of a selection of languages.
+    """
+    try:
+        del instance._prefetched_objects_cache[related_name]
+    except (AttributeError, KeyError):
+        pass
+
+    prefix = '_prefetched_{0}:'.format(related_name)
+    for attr in [attr for attr in instance.__dict__ if attr.startswith(prefix)]:
+        del instance.__dict__[attr]
+
+
+def get_translations_prefetch(shared_model, related_name=None, languages=None, prefix=''):
+    """
+    Create a :class:`~django.db.models.Prefetch` object for the translations of a model.
+
+    When ``languages`` is given, only those translations are fetched.
+    These are stored in a private attribute instead of the prefetch cache of the relation,
+    as parler expects that cache to hold all languages. The serializer fields read this attribute
+    when they receive the same languages, see :func:`get_prefetched_translations`.
+    The ``prefix`` allows prefetching the translations of a related model (e.g. ``"countries__"``).
+
+    :param shared_model: The shared model.
+    :type shared_model: :class:`parler.models.TranslatableModel`
+    """
+    meta = shared_model._parler_meta._get_extension_by_related_name(related_name)
+    if not languages:
+        return Prefetch(prefix + meta.rel_name)
+
+    return Prefetch(
+        prefix + meta.rel_name,
+        queryset=meta.model._default_manager.filter(language_code__in=languages),
+        to_attr=get_translations_prefetch_attr(meta.rel_name, languages),
+    )
+
+
+def prefetch_translations(queryset, languages=None):
+    """
+    Prefetch all translations of the queryset model, optionally limited to the given languages.
+
+    This allows the :class:`~parler_rest.fields.TranslatedFieldsField` to serialize
+    a list with a constant number of queries, also when ``context['languages']`` is used.
+    The languages should be the same as those of the serializer context::
+
+        queryset = prefetch_translations(Country.objects.all(), languages=['en', 'es'])
+    """
+    shared_model = queryset.model
+    return queryset.prefetch_related(*[
+        get_translations_prefetch(shared_model, meta.rel_name, languages=languages)
+        for meta in shared_model._parler_meta
+    ])
+
+
+def load_translations(instance, meta, language_codes):
+    """
+    Read the translations of the given languages with a single query, into parler's local cache of the object.
+    Languages that are already cached, or prefetched, are not fetched again.
+
+    :type meta: :class:`~parler.models.ParlerMeta`
+    """
+    local_cache = instance._translations_cache[meta.model]
+    language_codes = [lang_code for lang_code in language_codes if lang_code not in local_cache]
+    if not language_codes or instance.pk is None or instance._state.adding:
+        return
+    if get_prefetched_translations(instance, meta.rel_name) is not None:
+        return  # parler reads these itself
+
+    translations = meta.model._default_manager.using(instance._state.db).filter(
+        master_id=instance.pk, language_code__in=language_codes
+    )
+    for translation in translations:
+        translation.master = instance
+        local_cache[translation.language_code] = translation
+
+    # Tell parler these don't exist, so it doesn't query them again.
+    for lang_code in language_codes:
+        local_cache.setdefault(lang_code, MISSING)
+
+
+def get_modified_translated_fields(translation):
+    """
+    Return the names of the fields that are modified since the translation was loaded or saved.
+    """
+    fields = [
+        field for field in translation._meta.get_fields()
+        if not field.is_relation or field.many_to_one
+    ]
+    return [
+        field.name for field, old_value, new_value
+        in zip(fields, translation._original_values, translation._get_field_values())
+        if old_value != new_value
+    ]
+
+
+async def aprefetch_related_objects(objects, *lookups):
+    """
+    Async version of :func:`~django.db.models.prefetch_related_objects`.
+    On Django versions before 5.2, the prefetches are performed in a single ``sync_to_async()`` call.
+    """
+    if _aprefetch_related_objects is not None:
+        await _aprefetch_related_objects(objects, *lookups)
+    else:
+        from asgiref.sync import sync_to_async  # Not installed with Django 2.2
+
+        await sync_to_async(prefetch_related_objects)(objects, *lookups)
+
+
+async def aiterate_queryset(queryset):
+    """
+    Read all results of a queryset, with the async ORM when it's available (Django 4.1+).
+    """
+    if hasattr(queryset, '__aiter__'):
+        return [item async for item in queryset]
+
+    from asgiref.sync import sync_to_async
+
+    return await sync_to_async(list)(queryset)
+
+
+def delete_other_translations(instance, meta, language_codes, using=None):
+    """
+    Delete the translations of an object that are not in the given languages, with a single ``DELETE`` query.
+    When other models refer to the translations model, or it has many-to-many fields,
+    ``QuerySet.delete()`` is used instead so these relations are cascaded.
+
+    Like bulk queries, this doesn't send parler's ``post_translation_delete`` signal.
+    The local caches of the object are updated, use :func:`clear_translations_cache` to clear the shared caches.
+
+    :type meta: :class:`~parler.models.ParlerMeta`
+    :returns: The number of deleted translations.
+    """
+    model = meta.model
+    using = using or router.db_for_write(model, instance=instance)
+    queryset = model._default_manager.using(using).filter(master_id=instance.pk)
+    if language_codes:
+        queryset = queryset.exclude(language_code__in=language_codes)
+    if _has_delete_relations(model):
+        deleted = queryset.delete()[1].get(model._meta.label, 0)
+    else:
+        deleted = queryset._raw_delete(using)
+
+    # Tell parler these no longer exist
+    local_cache = instance._translations_cache[meta.model]
+    for lang_code in local_cache:
+        if lang_code not in language_codes:
+            local_cache[lang_code] = MISSING
+    clear_prefetched_translations(instance, meta.rel_name)
+    return deleted
+
+
+def _has_delete_relations(model):
+    # Relations that a delete should cascade to, which the raw DELETE query skips.
+    return bool(model._meta.related_objects or model._meta.many_to_many)
+
+
+def clear_translations_cache(instance, metas=None):
+    """
+    Remove the cached translations of an object, in all languages,
+    from both the parler cache and the :mod:`parler_rest.cache` caches.
+    """
+    metas = metas or list(instance._parler_meta)
+    if parler_appsettings.PARLER_ENABLE_CACHING:
+        language_codes = set(code for code, name in settings.LANGUAGES)
+        for meta in metas:
+            language_codes.update(instance._translations_cache[meta.model])
+        cache.delete_many([
+            get_translation_cache_key(meta.model, instance.pk, lang_code)
+            for meta in metas for lang_code in language_codes
+        ])
+    invalidate_cached_objects(instance.__class__, [instance.pk])
+
+
+def _load_created_pks(model, created, using):
+    # Fill in the primary keys that bulk_create() didn't set, so parler's cache doesn't insert these again.
+    pks = {
+        (master_id, language_code): pk
+        for pk, master_id, language_code in model._default_manager.using(using).filter(
+            master_id__in=set(translation.master_id for translation in created),
+            language_code__in=set(translation.language_code for translation in created),
+        ).values_list('pk', 'master_id', 'language_code')
+    }
+    for translation in created:
+        translation.pk = pks[(translation.master_id, translation.language_code)]
+
+
+def can_return_rows_from_bulk_insert(connection):
+    """
+    Tell whether ``bulk_create()`` sets the primary keys of the created objects on this database.
+    """
+    features = connection.features
+    # Django 3.0 renamed the can_return_ids_from_bulk_insert feature flag.
+    return getattr(
+        features, 'can_return_rows_from_bulk_insert', getattr(features, 'can_return_ids_from_bulk_insert', False)
+    )
+
+
+def bulk_save_translations(shared_model, items, send_signals=False, check_existing=True):
+    """
+    Save the translations of one or more objects with bulk queries.
+
+    For every translations model, the existing translations are read with a single query,
+    and written using one ``bulk_create()`` and one ``bulk_update()`` call.
+    Translations that are prefetched, or in parler's local cache of the object, are not read again.
+    Existing translations are only updated when their values changed.
+    This bypasses the :meth:`~parler.models.TranslatableModelMixin.save_translations` hooks
+    of the model. Use ``send_signals=True`` to still send parler's
+    ``pre_translation_save`` and ``post_translation_save`` signals for each translation.
+
+    :param shared_model: The shared model.
+    :type shared_model: :class:`parler.models.TranslatableModel`
+    :param items: A list of ``(instance, translations)`` tuples, where translations is a dict of
+        ``{meta: {language_code: {field_name: value}}}`` with the :class:`~parler.models.ParlerMeta` as key.
+    :param check_existing: Whether existing translations should be updated.
+        Pass ``False`` for objects that were just created, to skip reading the existing translations.
+    """
+    for meta in shared_model._parler_meta:
+        meta_items = [(instance, translations[meta]) for instance, translations in items if translations.get(meta)]
+        if not meta_items:
+            continue
+
+        _bulk_save_translations_model(
+            meta, meta_items, send_signals=send_signals, check_existing=check_existing,
+            using=router.db_for_write(meta.model)
+        )
+
+
+def _get_existing_translations(meta, items, check_existing, using):
+    # Read the translations from the prefetch or parler's local cache, and only query the others.
+    model = meta.model
+    existing = {}
+    unknown_pks = set()
+    unknown_languages = set()
+    for instance, translations in items:
+        local_cache = instance._translations_cache[model]
+        prefetched = get_prefetched_translations(instance, meta.rel_name)
+        if prefetched is not None:
+            prefetched = {translation.language_code: translation for translation in prefetched}
+
+        for language_code in translations:
+            translation = local_cache.get(language_code)
+            if translation is None and prefetched is not None:
+                translation = prefetched.get(language_code, MISSING)
+            if translation is None:
+                if check_existing:
+                    unknown_pks.add(instance.pk)
+                    unknown_languages.add(language_code)
+            elif translation is not MISSING and translation.pk is not None:
+                existing[(instance.pk, language_code)] = translation
+
+    if unknown_pks:
+        for translation in model._default_manager.using(using).filter(
+            master_id__in=unknown_pks, language_code__in=unknown_languages
+        ):
+            existing.setdefault((translation.master_id, translation.language_code), translation)
+    return existing
+
+
+def _bulk_save_translations_model(meta, items, send_signals, check_existing, using):
+    model = meta.model
+    existing = _get_existing_translations(meta, items, check_existing, using)
+
+    created = []
+    updated = []
+    update_fields = set()
+    for instance, translations in items:
+        for language_code, values in translations.items():
+            translation = existing.get((instance.pk, language_code))
+            if translation is None:
+                translation = model(language_code=language_code, master=instance)
+                created.append(translation)
+            else:
+                # Only write the translations and columns that changed.
+                changed = [field_name for field_name, value in values.items() if getattr(translation, field_name) != value]
+                translation.master = instance
+                if changed:
+                    updated.append(translation)
+                    update_fields.update(changed)
+
+            for field_name, value in values.items():
+                setattr(translation, field_name, value)
+
+            # Keep the local parler cache in sync
+            instance._translations_cache[model][language_code] = translation
+
+    if send_signals:
+        for translation in created + updated:
+            parler_signals.pre_translation_save.send(
+                sender=meta.shared_model, instance=translation, raw=False, using=using
+            )
+
+    with ExitStack() as stack:
+        if created and updated:
+            # Each query is atomic by itself, only combine these when both are performed.
+            stack.enter_context(transaction.atomic(using=using))
+        if created:
+            model._default_manager.using(using).bulk_create(created)
+            if not can_return_rows_from_bulk_insert(connections[using]):
+                _load_created_pks(model, created, using)
+        if updated and update_fields:
+            if len(updated) == 1:
+                # A plain UPDATE query, bulk_update() would start a transaction for it.
+                translation = updated[0]
+                model._default_manager.using(using).filter(pk=translation.pk).update(
+                    **{field_name: getattr(translation, field_name) for field_name in update_fields}
+                )
+            else:
+                model._default_manager.using(using).bulk_update(updated, sorted(update_fields))
+
+    for translation in created + updated:
+        translation._original_values = translation._get_field_values()
+
+    # Clear the stale caches, the next read will fetch the new values.
+    for instance, translations in items:
+        clear_prefetched_translations(instance, meta.rel_name)
+
+    # The post_save signal is not sent for bulk queries
+    invalidate_cached_objects(meta.shared_model, [instance.pk for instance, translations in items], using=using)
+
+    if parler_appsettings.PARLER_ENABLE_CACHING:
+        cache.delete_many([
+            get_translation_cache_key(model, translation.master_id, translation.language_code)
+            for translation in created + updated
+        ])
+
+    if send_signals:
+        for translation in created:
+            parler_signals.post_translation_save.send(
+                sender=meta.shared_model, instance=translation, created=True, raw=False, using=using
+            )
+        for translation in updated:
+            parler_signals.post_translation_save.send(
+                sender=meta.shared_model, instance=translation, created=False, raw=False, using=using
+            )
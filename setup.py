@@ -67,7 +67,7 @@ setup(
     url='https://github.com/edoburu/django-parler-rest',
     download_url='https://github.com/edoburu/django-parler-rest/zipball/master',
 
-    packages=['parler_rest'],
+    packages=find_packages(include=['parler_rest', 'parler_rest.*']),
     include_package_data=True,
 
     zip_safe=False,
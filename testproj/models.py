@@ -1,4 +1,6 @@
 from django.db import models
+from django.urls import reverse
+from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 
 from parler.models import TranslatableModel, TranslatedFields, TranslatedField, TranslatedFieldsModel
@@ -22,6 +24,9 @@ class Country(TranslatableModel):
     def __str__(self):
         return self.name
 
+    def get_absolute_url(self):
+        return reverse('country-detail', kwargs={'pk': self.pk, 'slug': slugify(self.name)})
+
 
 class Picture(TranslatableModel):
 
@@ -51,3 +56,6 @@ class PictureTranslation(TranslatedFieldsModel):
 
     class Meta:
         unique_together = [('language_code', 'master')]
+
+    def shout(self):
+        return self.caption + "!"
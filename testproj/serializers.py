@@ -1,8 +1,14 @@
 from rest_framework import serializers
 
-from parler_rest.serializers import TranslatableModelSerializer, TranslatedFieldsField, TranslatedField
+from parler_rest.serializers import (
+    TranslatableModelSerializer,
+    TranslatedAbsoluteUrlField,
+    TranslatedField,
+    TranslatedFieldsField,
+)
+from parler_rest.utils import create_translated_fields_serializer
 
-from .models import Country, Picture
+from .models import Country, Picture, PictureTranslation
 
 
 class CountryTranslatedSerializer(TranslatableModelSerializer):
@@ -17,6 +23,105 @@ class CountryTranslatedSerializer(TranslatableModelSerializer):
         fields = ('pk', 'country_code', 'translations')
 
 
+class CountryFastTranslatedSerializer(TranslatableModelSerializer):
+    """
+    A serializer that reads the translated fields directly.
+    """
+
+    translations = TranslatedFieldsField(shared_model=Country, fast=True)
+
+    class Meta:
+        model = Country
+        fields = ('pk', 'country_code', 'translations')
+
+
+class CountryAbsoluteUrlTranslatedSerializer(TranslatableModelSerializer):
+    """
+    A serializer with an absolute URL in the translations.
+    """
+
+    translations = TranslatedFieldsField(
+        serializer_class=create_translated_fields_serializer(
+            Country, meta={'fields': ['name', 'absolute_url']}, absolute_url=TranslatedAbsoluteUrlField()
+        ),
+        fast=True,
+    )
+
+    class Meta:
+        model = Country
+        fields = ('pk', 'country_code', 'translations')
+
+
+class CountryTranslationIdSerializer(TranslatableModelSerializer):
+    """
+    A serializer that exposes the primary key of the translations.
+    """
+
+    translations = TranslatedFieldsField(
+        serializer_class=create_translated_fields_serializer(Country, meta={'fields': ['id', 'name']}),
+    )
+
+    class Meta:
+        model = Country
+        fields = ('pk', 'country_code', 'translations')
+
+
+class CountryCachedUrlTranslatedSerializer(TranslatableModelSerializer):
+    """
+    A serializer with a cached absolute URL in the translations.
+    """
+
+    translations = TranslatedFieldsField(
+        serializer_class=create_translated_fields_serializer(
+            Country, meta={'fields': ['name', 'absolute_url']}, absolute_url=TranslatedAbsoluteUrlField(cache='default')
+        ),
+    )
+
+    class Meta:
+        model = Country
+        fields = ('pk', 'country_code', 'translations')
+
+
+class CountryCachedTranslatedSerializer(TranslatableModelSerializer):
+    """
+    A serializer that caches the representation of each object.
+    """
+
+    translations = TranslatedFieldsField(shared_model=Country)
+
+    class Meta:
+        model = Country
+        fields = ('pk', 'country_code', 'translations')
+        representation_cache = 'default'
+
+
+class CountryBulkTranslatedSerializer(TranslatableModelSerializer):
+    """
+    A serializer that writes the translations with bulk queries.
+    """
+
+    translations = TranslatedFieldsField(shared_model=Country)
+
+    class Meta:
+        model = Country
+        fields = ('pk', 'country_code', 'translations')
+        bulk_save_translations = True
+        send_translation_signals = True
+        bulk_create = True
+
+
+class CountryReplaceTranslatedSerializer(TranslatableModelSerializer):
+    """
+    A serializer that replaces all existing translations.
+    """
+
+    translations = TranslatedFieldsField(shared_model=Country, replace=True)
+
+    class Meta:
+        model = Country
+        fields = ('pk', 'country_code', 'translations')
+
+
 class CountryAutoSharedModelTranslatedSerializer(TranslatableModelSerializer):
     """
     A serializer with both translated fields and translation model deduced.
@@ -46,6 +151,49 @@ class CountryExplicitTranslatedSerializer(TranslatableModelSerializer):
         fields = ('pk', 'country_code', 'trans')
 
 
+class CountryTranslatedFieldsSerializer(TranslatableModelSerializer):
+    """
+    A serializer with several translated fields.
+    """
+
+    name = TranslatedField()
+    url = TranslatedField()
+
+    class Meta:
+        model = Country
+        fields = ('pk', 'country_code', 'name', 'url')
+
+
+class CountryRenamedTranslatedSerializer(TranslatableModelSerializer):
+    """
+    A serializer with translated fields that are named differently than the model fields.
+    """
+
+    translations = TranslatedFieldsField(
+        serializer_class=create_translated_fields_serializer(
+            Country, meta={'fields': ['title', 'url']}, title=serializers.CharField(source='name')
+        ),
+    )
+    title = TranslatedField(source='name')
+
+    class Meta:
+        model = Country
+        fields = ('pk', 'country_code', 'translations', 'title')
+
+
+class CountrySingleLanguageSerializer(TranslatableModelSerializer):
+    """
+    A serializer that exposes the translations of the active language.
+    """
+
+    translations = TranslatedFieldsField(shared_model=Country, single_language=True)
+    name = TranslatedField(single_language=True)
+
+    class Meta:
+        model = Country
+        fields = ('pk', 'country_code', 'translations', 'name')
+
+
 class ContinentCountriesTranslatedSerializer(serializers.Serializer):
     """
     A serializer with a nested translation serializer.
@@ -65,3 +213,27 @@ class PictureCaptionSerializer(TranslatableModelSerializer):
     class Meta:
         model = Picture
         fields = ('image_nr', 'caption')
+
+
+class PictureShoutTranslationSerializer(serializers.ModelSerializer):
+    """
+    A translation serializer that exposes a method of the translation model.
+    """
+
+    shout = serializers.ReadOnlyField()
+
+    class Meta:
+        model = PictureTranslation
+        fields = ('caption', 'shout')
+
+
+class PictureShoutSerializer(TranslatableModelSerializer):
+    """
+    A serializer with a model method in the translations.
+    """
+
+    translations = TranslatedFieldsField(serializer_class=PictureShoutTranslationSerializer, fast=True)
+
+    class Meta:
+        model = Picture
+        fields = ('image_nr', 'translations')
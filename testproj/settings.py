@@ -47,6 +47,7 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.sites',
     'parler',
+    'parler_rest',
     'rest_framework',
     'testproj',
 ]
@@ -89,6 +90,9 @@ LANGUAGES = [
 
 TIME_ZONE = 'UTC'
 
+PARLER_REST_LANGUAGES_QUERY_PARAM = 'languages'
+PARLER_REST_TRANSLATED_FIELDS_QUERY_PARAM = 'translated_fields'
+
 USE_I18N = True
 
 USE_L10N = True
@@ -1,20 +1,64 @@
 """Serializer integration tests."""
 
+import io
+import json
+import os
+import shutil
+import tempfile
 import unittest
+import warnings
+from unittest import mock
 
-from django.test import TestCase
+import django
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import translation
+from django.db import connection
+from django.db.models import QuerySet
+from django.db.models.signals import post_save
 
+from parler.signals import post_translation_save
+from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
 from parler.tests.utils import override_parler_settings
 
-from parler_rest.utils import create_translated_fields_serializer
+from parler_rest.serializers import TranslatableListSerializer
+from parler_rest.cache import REPRESENTATION_CACHE, get_cached_object, set_cached_object
+from parler_rest.fields import TranslatedAbsoluteUrlField, TranslatedField, TranslatedFieldsField
+from parler_rest.instrumentation import Instrumentation, instrumentation
+from parler_rest.serializers import TranslatableModelSerializer
+from parler_rest.streaming import get_streaming_response
+from parler_rest.testing import assert_no_translation_queries_per_row, assert_translation_queries_constant
+from parler_rest.utils import (
+    can_return_rows_from_bulk_insert,
+    clear_translated_fields_serializer_cache,
+    create_translated_fields_serializer,
+    get_parler_meta_by_source,
+    prefetch_translations,
+)
 
 from .models import Country, Picture
 from .serializers import (
     CountryTranslatedSerializer,
     CountryAutoSharedModelTranslatedSerializer,
     CountryExplicitTranslatedSerializer,
+    CountryAbsoluteUrlTranslatedSerializer,
+    CountryFastTranslatedSerializer,
+    CountryTranslationIdSerializer,
+    CountryCachedUrlTranslatedSerializer,
+    CountryCachedTranslatedSerializer,
+    CountryBulkTranslatedSerializer,
+    CountryReplaceTranslatedSerializer,
+    CountryTranslatedFieldsSerializer,
+    CountryRenamedTranslatedSerializer,
+    CountrySingleLanguageSerializer,
     ContinentCountriesTranslatedSerializer,
     PictureCaptionSerializer,
+    PictureShoutSerializer,
+    PictureShoutTranslationSerializer,
 )
 
 
@@ -25,6 +69,8 @@ class CountryTranslatedSerializerTestCase(TestCase):
     # skips saves after the first test.
     @override_parler_settings(PARLER_ENABLE_CACHING=False)
     def setUp(self):
+        # Translations that previous tests cached are no longer in the database.
+        cache.clear()
         self.instance = Country.objects.create(
             country_code='ES', name="Spain",
             url="http://en.wikipedia.org/wiki/Spain"
@@ -76,6 +122,476 @@ class CountryTranslatedSerializerTestCase(TestCase):
         serializer = CountryTranslatedSerializer(self.instance, context=context)
         self.assertCountEqual(serializer.data, expected)
 
+    def test_translations_serialization_prefetched_languages(self):
+        Country.objects.create(country_code='FR', name="France")
+        queryset = Country.objects.order_by('pk').prefetch_related('translations')
+        context = {'languages': ['es']}
+        with self.assertNumQueries(2):
+            data = CountryTranslatedSerializer(queryset, many=True, context=context).data
+        self.assertEqual(list(data[0]['translations']), ['es'])
+        self.assertEqual(data[1]['translations'], {})
+
+    def test_translations_serialization_prefetch_helper(self):
+        Country.objects.create(country_code='FR', name="France")
+        queryset = prefetch_translations(Country.objects.order_by('pk'), languages=['en'])
+        with self.assertNumQueries(2):
+            data = CountryTranslatedSerializer(queryset, many=True, context={'languages': ['en']}).data
+        self.assertEqual(list(data[0]['translations']), ['en'])
+        self.assertEqual(data[1]['translations']['en']['name'], "France")
+
+    def test_setup_eager_loading(self):
+        Country.objects.create(country_code='FR', name="France")
+        context = {'languages': ['en']}
+        queryset = CountryTranslatedSerializer.setup_eager_loading(Country.objects.all(), context=context)
+        with self.assertNumQueries(2):
+            data = CountryTranslatedSerializer(queryset, many=True, context=context).data
+        self.assertEqual(len(data), 2)
+
+    def test_setup_eager_loading_write_request(self):
+        request = RequestFactory().put('/?languages=es')
+        queryset = CountryTranslatedSerializer.setup_eager_loading(Country.objects.all(), context={'request': request})
+        instance = queryset.get(pk=self.instance.pk)
+        self.assertEqual(len(instance._prefetched_objects_cache['translations']), 2)
+
+        request = RequestFactory().get('/?languages=es')
+        queryset = CountryTranslatedSerializer.setup_eager_loading(Country.objects.all(), context={'request': request})
+        instance = queryset.get(pk=self.instance.pk)
+        self.assertNotIn('translations', getattr(instance, '_prefetched_objects_cache', {}))
+
+    def test_setup_eager_loading_languages_keeps_parler_cache(self):
+        # Parler still sees all languages, the selection is prefetched separately.
+        context = {'languages': ['es']}
+        queryset = CountryTranslatedSerializer.setup_eager_loading(Country.objects.all(), context=context)
+        instance = queryset.get(pk=self.instance.pk)
+        instance.set_current_language('en')
+        self.assertEqual(instance.name, "Spain")
+
+        data = {'country_code': 'ES', 'translations': {'en': {'name': "Kingdom of Spain"}}}
+        serializer = CountryTranslatedSerializer(instance, data=data, context=context)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        serializer.save()
+        self.assertEqual(Country.objects.get(pk=self.instance.pk).translations.count(), 2)
+        self.assertEqual(list(serializer.data['translations']), ['es'])
+
+    def test_list_serializer_class(self):
+        serializer = CountryTranslatedSerializer(Country.objects.all(), many=True, allow_empty=False)
+        self.assertIs(type(serializer), TranslatableListSerializer)
+        self.assertFalse(serializer.allow_empty)
+
+        class CustomListSerializer(serializers.ListSerializer):
+            pass
+
+        class CountryCustomListSerializer(CountryTranslatedSerializer):
+            class Meta(CountryTranslatedSerializer.Meta):
+                list_serializer_class = CustomListSerializer
+
+        serializer = CountryCustomListSerializer(Country.objects.all(), many=True)
+        self.assertIs(type(serializer), CustomListSerializer)
+
+    @override_settings(DEBUG=True)
+    def test_list_without_prefetch_warns(self):
+        Country.objects.create(country_code='FR', name="France")
+        serializer = CountryTranslatedSerializer(Country.objects.all(), many=True)
+        self.assertIsInstance(serializer, TranslatableListSerializer)
+        with self.assertWarns(RuntimeWarning):
+            serializer.data
+
+        queryset = CountryTranslatedSerializer.setup_eager_loading(Country.objects.all())
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            CountryTranslatedSerializer(queryset, many=True).data
+
+    def test_translation_queries_per_row(self):
+        Country.objects.create(country_code='FR', name="France")
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            with self.assertRaisesMessage(AssertionError, "caused by: translations"):
+                assert_translation_queries_constant(CountryTranslatedSerializer, Country.objects.all())
+
+            with self.assertRaisesMessage(AssertionError, "performed per row by: translations"):
+                with assert_no_translation_queries_per_row():
+                    CountryTranslatedSerializer(Country.objects.all(), many=True).data
+
+        queryset = CountryTranslatedSerializer.setup_eager_loading(Country.objects.all())
+        logs = assert_translation_queries_constant(CountryTranslatedSerializer, queryset)
+        self.assertEqual([len(log) for log in logs], [1, 1])
+        with assert_no_translation_queries_per_row() as log:
+            CountryTranslatedSerializer(queryset.all(), many=True).data
+        self.assertEqual(log.by_field(), {None: 1})
+
+    def test_instrumentation(self):
+        class Collector(Instrumentation):
+            def __init__(self):
+                self.measurements = []
+
+            def record(self, measurement):
+                self.measurements.append(measurement)
+
+        Country.objects.create(country_code='FR', name="France")
+        collector = Collector()
+        queryset = CountryTranslatedSerializer.setup_eager_loading(Country.objects.order_by('pk'))
+        with instrumentation(collector):
+            CountryTranslatedSerializer(queryset, many=True).data
+            CountryTranslatedFieldsSerializer(Country.objects.order_by('pk')[:1], many=True).data
+
+        (fields, fields2, list1, name, url, list2) = collector.measurements
+        self.assertEqual(fields.operation, 'to_representation')
+        self.assertEqual(fields.field_name, 'translations')
+        self.assertEqual((fields.rows, fields.languages, fields.queries), (1, 2, 0))
+        self.assertGreater(fields.duration, 0)
+        self.assertEqual(fields2.languages, 1)
+        self.assertEqual(name.operation, 'get_attribute')
+        self.assertEqual([(m.field_name, m.languages) for m in (name, url)], [('name', 2), ('url', 2)])
+
+        # The lists report the number of objects, and the queries of all rows
+        self.assertEqual(list1.operation, 'list_to_representation')
+        self.assertEqual((list1.rows, list1.languages, list1.queries), (2, 0, 2))
+        self.assertEqual((list2.rows, list2.queries), (1, 2))
+        self.assertGreaterEqual(list2.duration, name.duration + url.duration)
+
+        data = {'country_code': 'ES', 'translations': {'en': {'name': "Kingdom of Spain"}}}
+        serializer = CountryTranslatedSerializer(self.instance, data=data, partial=True)
+        with instrumentation(collector):
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
+        self.assertEqual(
+            [(m.operation, m.languages) for m in collector.measurements[6:]],
+            [('to_internal_value', 1), ('save_translations', 1)]
+        )
+        self.assertGreater(collector.measurements[-1].queries, 0)
+
+        # Chunks of a streamed list are reported separately
+        del collector.measurements[:]
+        serializer = CountryTranslatedSerializer(Country.objects.order_by('pk'), many=True)
+        with instrumentation(collector):
+            list(serializer.iter_representation(chunk_size=1))
+        chunks = [m for m in collector.measurements if m.operation == 'list_to_representation']
+        self.assertEqual([(m.rows, m.queries) for m in chunks], [(1, 1), (1, 1)])
+
+        # Disabled again
+        CountryTranslatedSerializer(queryset.all(), many=True).data
+        self.assertEqual(len(collector.measurements), 4)
+
+        # The methods are only wrapped while the hook is active
+        self.assertFalse(hasattr(TranslatedFieldsField.to_representation, '__wrapped__'))
+        with instrumentation(collector):
+            self.assertTrue(hasattr(TranslatedFieldsField.to_representation, '__wrapped__'))
+
+    def test_translations_serialization_streaming(self):
+        Country.objects.create(country_code='FR', name="France")
+        expected = CountryTranslatedSerializer(
+            CountryTranslatedSerializer.setup_eager_loading(Country.objects.order_by('pk')), many=True
+        ).data
+
+        # Countries, and the translations per chunk
+        serializer = CountryTranslatedSerializer(Country.objects.order_by('pk'), many=True)
+        with self.assertNumQueries(3):
+            rows = list(serializer.iter_representation(chunk_size=1))
+        self.assertEqual(rows, expected)
+
+        serializer = CountryTranslatedSerializer(Country.objects.order_by('pk'), many=True)
+        response = get_streaming_response(serializer, format='ndjson')
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        self.assertEqual([json.loads(line) for line in lines], expected)
+
+        serializer = CountryTranslatedSerializer(Country.objects.order_by('pk'), many=True)
+        response = get_streaming_response(serializer)
+        self.assertEqual(json.loads(b''.join(response.streaming_content)), expected)
+
+    @unittest.skipIf(django.VERSION < (4, 1), "The async ORM requires Django 4.1")
+    async def test_async_serialization(self):
+        await Country.objects.acreate(country_code='FR')
+        from asgiref.sync import sync_to_async
+
+        expected = await sync_to_async(lambda: CountryTranslatedSerializer(
+            CountryTranslatedSerializer.setup_eager_loading(Country.objects.order_by('pk')), many=True
+        ).data)()
+
+        # Any synchronous query would raise SynchronousOnlyOperation
+        serializer = CountryTranslatedSerializer(Country.objects.order_by('pk'), many=True)
+        self.assertEqual(await serializer.ato_representation(serializer.instance), expected)
+
+        context = {'translation_values': True, 'languages': ['es']}
+        serializer = CountryTranslatedSerializer(Country.objects.order_by('pk'), many=True, context=context)
+        data = await serializer.ato_representation(serializer.instance)
+        self.assertEqual([country['translations'] for country in data], [{'es': expected[0]['translations']['es']}, {}])
+
+        instance = await Country.objects.aget(pk=self.instance.pk)
+        serializer = CountryTranslatedFieldsSerializer(instance)
+        data = await serializer.ato_representation(instance)
+        self.assertEqual(data['name'], {'en': "Spain", 'es': "España"})
+
+    @unittest.skipIf(django.VERSION < (4, 1), "The async ORM requires Django 4.1")
+    async def test_async_save_translations(self):
+        instance = await Country.objects.aget(pk=self.instance.pk)
+        serializer = CountryTranslatedSerializer(instance)
+        await serializer.asave_translations(instance, {'translations': {'fr': {'name': "Espagne"}}})
+
+        translation = await Country._parler_meta.root_model.objects.aget(master_id=instance.pk, language_code='fr')
+        self.assertEqual(translation.name, "Espagne")
+
+    def test_export_translations_command(self):
+        Country.objects.create(country_code='FR', name="France")
+        Country.objects.create(country_code='NL', name="Netherlands")
+        expected = CountryTranslatedSerializer(Country.objects.order_by('pk'), many=True).data
+
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        output = os.path.join(tmpdir, 'countries.ndjson')
+        stdout = io.StringIO()
+        call_command(
+            'export_translations', 'testproj.serializers.CountryTranslatedSerializer', output,
+            workers=1, range_size=2, stdout=stdout
+        )
+        self.assertIn("Exported 3 objects in 2 ranges", stdout.getvalue())
+        with open(output, encoding='utf-8') as f:
+            self.assertEqual([json.loads(line) for line in f], expected)
+        self.assertEqual(os.listdir(tmpdir), ['countries.ndjson'])
+
+        shards = os.path.join(tmpdir, 'shards')
+        call_command(
+            'export_translations', 'testproj.serializers.CountryTranslatedSerializer', shards,
+            workers=1, range_size=2, shards=True, languages='es', stdout=stdout
+        )
+        self.assertEqual(sorted(os.listdir(shards)), ['part-00000.ndjson', 'part-00001.ndjson'])
+        with open(os.path.join(shards, 'part-00000.ndjson'), encoding='utf-8') as f:
+            self.assertEqual(json.loads(f.readline())['translations'], {'es': expected[0]['translations']['es']})
+
+    def test_nested_translations_prefetches(self):
+        countries = ContinentCountriesTranslatedSerializer().fields['countries']
+        self.assertIsInstance(countries, TranslatableListSerializer)
+        prefetches = countries.child.get_translations_prefetches(prefix='countries__')
+        self.assertEqual([p.prefetch_to for p in prefetches], ['countries__translations'])
+
+    def test_translation_serializer_shared_by_rows(self):
+        Country.objects.create(country_code='FR', name="France")
+        context = {'languages': ['en']}
+        serializer = CountryTranslatedSerializer(Country.objects.all(), many=True, context=context)
+        field = serializer.child.fields['translations']
+        translation_serializer = field.translation_serializer
+        self.assertEqual(len(serializer.data), 2)
+        self.assertIs(field.translation_serializer, translation_serializer)
+        self.assertEqual(translation_serializer.context, context)
+
+    def test_translation_serializer_language_code(self):
+        class LanguageCodeSerializer(TranslatableModelSerializer):
+            translations = TranslatedFieldsField(
+                serializer_class=create_translated_fields_serializer(Country)
+            )
+
+            class Meta:
+                model = Country
+                fields = ('pk', 'translations')
+
+        with self.assertRaises(ImproperlyConfigured):
+            LanguageCodeSerializer(self.instance).fields
+
+    def test_fast_translations_serialization(self):
+        Country.objects.create(country_code='FR', name="France")
+        queryset = CountryTranslatedSerializer.setup_eager_loading(Country.objects.order_by('pk'))
+        serializer = CountryFastTranslatedSerializer(queryset, many=True)
+        self.assertIsNotNone(serializer.child.fields['translations'].plain_getter)
+        data = serializer.data
+        self.assertEqual(data, CountryTranslatedSerializer(queryset, many=True).data)
+        self.assertIs(type(data[0]['translations']), dict)
+        self.assertIs(type(data[0]['translations']['es']), dict)
+
+    def test_fast_translations_serialization_fallback(self):
+        request = RequestFactory().get('/')
+        serializer = CountryAbsoluteUrlTranslatedSerializer(self.instance, context={'request': request})
+        self.assertIsNone(serializer.fields['translations'].plain_getter)
+        self.assertEqual(serializer.data['translations']['es'], {
+            'name': "España",
+            'absolute_url': "http://testserver/countries/{0}/espana/".format(self.instance.pk),
+        })
+
+    def test_translations_serialization_values(self):
+        Country.objects.create(country_code='FR', name="France")
+        queryset = Country.objects.order_by('pk')
+        expected = CountryTranslatedSerializer(queryset.prefetch_related('translations'), many=True).data
+        context = {'translation_values': True}
+        with self.assertNumQueries(2):
+            data = CountryTranslatedSerializer(queryset, many=True, context=context).data
+        self.assertEqual(data, expected)
+
+        context = {'translation_values': True, 'languages': ['es']}
+        with self.assertNumQueries(2):
+            data = CountryTranslatedSerializer(queryset.all(), many=True, context=context).data
+        self.assertEqual(data[0]['translations'], {'es': expected[0]['translations']['es']})
+        self.assertEqual(data[1]['translations'], {})
+
+    def test_translations_serialization_values_fallback(self):
+        # The values() rows don't contain the 'id', so the translations are prefetched instead.
+        Country.objects.create(country_code='FR', name="France")
+        queryset = Country.objects.order_by('pk')
+        expected = CountryTranslationIdSerializer(queryset.prefetch_related('translations'), many=True).data
+        serializer = CountryTranslationIdSerializer(queryset.all(), many=True, context={'translation_values': True})
+        self.assertIsNone(serializer.child.fields['translations'].values_getter)
+        with self.assertNumQueries(2):
+            data = serializer.data
+        self.assertEqual(data, expected)
+        self.assertIn('id', data[0]['translations']['es'])
+
+    def test_translated_fields_single_pass(self):
+        serializer = CountryTranslatedFieldsSerializer(self.instance)
+        with self.assertNumQueries(1):
+            data = serializer.data
+        self.assertEqual(data['name'], {'en': "Spain", 'es': "España"})
+        self.assertEqual(data['url'], {
+            'en': "http://en.wikipedia.org/wiki/Spain",
+            'es': "http://es.wikipedia.org/wiki/España",
+        })
+
+    def test_cached_absolute_url(self):
+        request = RequestFactory().get('/')
+        context = {'request': request}
+        url = "http://testserver/countries/{0}/espana/".format(self.instance.pk)
+        cache.clear()
+
+        with mock.patch.object(Country, 'get_absolute_url', autospec=True, side_effect=Country.get_absolute_url) as m:
+            data = CountryCachedUrlTranslatedSerializer(self.instance, context=context).data
+            self.assertEqual(data['translations']['es']['absolute_url'], url)
+            self.assertEqual(m.call_count, 2)
+
+            data = CountryCachedUrlTranslatedSerializer(self.instance, context=context).data
+            self.assertEqual(data['translations']['es']['absolute_url'], url)
+            self.assertEqual(m.call_count, 2)
+
+            # Saving a translation invalidates the cache
+            self.instance.set_current_language('es')
+            self.instance.name = "Reino de España"
+            self.instance.save()
+            data = CountryCachedUrlTranslatedSerializer(self.instance, context=context).data
+            self.assertEqual(
+                data['translations']['es']['absolute_url'],
+                "http://testserver/countries/{0}/reino-de-espana/".format(self.instance.pk)
+            )
+            self.assertEqual(m.call_count, 4)
+
+    def test_translations_query_param_projection(self):
+        request = RequestFactory().get('/', {'languages': 'es', 'translated_fields': 'name'})
+        context = {'request': request}
+        data = CountryTranslatedSerializer(self.instance, context=context).data
+        self.assertEqual(data['translations'], {'es': {'name': "España"}})
+
+        data = CountryTranslatedFieldsSerializer(self.instance, context=context).data
+        self.assertEqual(data['name'], {'es': "España"})
+        self.assertNotIn('url', data)
+
+    def test_translations_query_param_projection_values(self):
+        request = RequestFactory().get('/', {'languages': 'es', 'translated_fields': 'name'})
+        context = {'request': request, 'translation_values': True}
+        with CaptureQueriesContext(connection) as queries:
+            data = CountryFastTranslatedSerializer(Country.objects.all(), many=True, context=context).data
+        self.assertEqual(data[0]['translations'], {'es': {'name': "España"}})
+        self.assertNotIn('"url"', queries[1]['sql'])
+
+    def test_translations_projection_field_name(self):
+        # The selection uses the name of the serializer field, not the model field.
+        for context in ({}, {'translation_values': True}):
+            context['translated_fields'] = ['title']
+            data = CountryRenamedTranslatedSerializer(Country.objects.all(), many=True, context=context).data
+            self.assertEqual(data[0]['translations']['es'], {'title': "España"})
+            self.assertEqual(data[0]['title'], {'en': "Spain", 'es': "España"})
+
+            context['translated_fields'] = ['name']
+            data = CountryRenamedTranslatedSerializer(Country.objects.all(), many=True, context=context).data
+            self.assertEqual(data[0]['translations']['es'], {})
+            self.assertNotIn('title', data[0])
+
+    def test_cached_representation(self):
+        Country.objects.create(country_code='FR', name="France")
+        cache.clear()
+
+        # Countries, translations
+        with self.assertNumQueries(2):
+            data = CountryCachedTranslatedSerializer(Country.objects.order_by('pk'), many=True).data
+        self.assertEqual(data[0]['translations']['es']['name'], "España")
+
+        # Only the countries
+        with self.assertNumQueries(1):
+            cached_data = CountryCachedTranslatedSerializer(Country.objects.order_by('pk'), many=True).data
+        self.assertEqual(cached_data, data)
+
+        # Other languages are cached separately
+        context = {'languages': ['es']}
+        data = CountryCachedTranslatedSerializer(self.instance, context=context).data
+        self.assertEqual(list(data['translations']), ['es'])
+
+        # Saving a translation invalidates the cache
+        self.instance.set_current_language('es')
+        self.instance.name = "Reino de España"
+        self.instance.save()
+        with self.assertNumQueries(2):
+            data = CountryCachedTranslatedSerializer(Country.objects.order_by('pk'), many=True).data
+        self.assertEqual(data[0]['translations']['es']['name'], "Reino de España")
+        self.assertEqual(data[1]['translations']['en']['name'], "France")
+
+    @unittest.skipIf(django.VERSION < (3, 2), "captureOnCommitCallbacks requires Django 3.2")
+    def test_cached_representation_commit(self):
+        cache.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.instance.set_current_language('es')
+            self.instance.name = "Reino de España"
+            self.instance.save()
+
+            # Another request caches the old output, before the transaction is committed.
+            set_cached_object('default', REPRESENTATION_CACHE, Country, self.instance.pk, {'old': {}})
+            self.assertIsNotNone(get_cached_object('default', REPRESENTATION_CACHE, Country, self.instance.pk))
+
+        self.assertIsNone(get_cached_object('default', REPRESENTATION_CACHE, Country, self.instance.pk))
+
+    def test_cached_representation_variants(self):
+        cache.clear()
+        with mock.patch('parler_rest.appsettings.PARLER_REST_REPRESENTATION_CACHE_MAX_VARIANTS', 2):
+            for languages in (['en'], ['es'], ['en', 'es']):
+                CountryCachedTranslatedSerializer(self.instance, context={'languages': languages}).data
+
+        variants = get_cached_object('default', REPRESENTATION_CACHE, Country, self.instance.pk)
+        self.assertEqual(len(variants), 2)
+        self.assertEqual([variant.split('|')[1] for variant in variants], ['es', 'en,es'])
+
+    def test_languages_query_param_validation(self):
+        request = RequestFactory().get('/', {'languages': 'ES,es'})
+        data = CountryCachedTranslatedSerializer(self.instance, context={'request': request}).data
+        self.assertEqual(list(data['translations']), ['es'])
+
+        request = RequestFactory().get('/', {'languages': 'es,xx'})
+        with self.assertRaises(serializers.ValidationError) as cm:
+            CountryCachedTranslatedSerializer(self.instance, context={'request': request}).data
+        self.assertEqual(cm.exception.detail, {'languages': ["Unknown language: xx"]})
+
+    def test_single_language_serialization(self):
+        Country.objects.create(country_code='FR', name="France")
+        queryset = CountrySingleLanguageSerializer.setup_eager_loading(Country.objects.order_by('pk'))
+
+        # France falls back to English, without additional queries
+        with translation.override('es'), self.assertNumQueries(2):
+            data = CountrySingleLanguageSerializer(queryset, many=True).data
+        self.assertEqual(data[0]['translations'], {'name': "España", 'url': "http://es.wikipedia.org/wiki/España"})
+        self.assertEqual([country['name'] for country in data], ["España", "France"])
+        self.assertEqual(data[1]['translations']['name'], "France")
+
+        context = {'language': 'en'}
+        data = CountrySingleLanguageSerializer(queryset.all(), many=True, context=context).data
+        self.assertEqual([country['name'] for country in data], ["Spain", "France"])
+
+    def test_single_language_deserialization(self):
+        data = {
+            'country_code': 'ES',
+            'name': "Reino de España",
+            'translations': {'name': "Reino de España", 'url': "http://es.example.com/"},
+        }
+        serializer = CountrySingleLanguageSerializer(self.instance, data=data, context={'language': 'es'})
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        serializer.save()
+
+        instance = Country.objects.get(pk=self.instance.pk)
+        instance.set_current_language('es')
+        self.assertEqual(instance.name, "Reino de España")
+        self.assertEqual(instance.url, "http://es.example.com/")
+
     def test_translations_validation(self):
         data = {
             'country_code': 'FR',
@@ -114,6 +630,52 @@ class CountryTranslatedSerializerTestCase(TestCase):
         self.assertIn('name', serializer.errors['translations']['en'])
         self.assertIn('url', serializer.errors['translations']['es'])
 
+    def test_translations_validation_unique(self):
+        class UniqueNameSerializer(serializers.ModelSerializer):
+            name = serializers.CharField(validators=[
+                UniqueValidator(queryset=Country._parler_meta.root_model.objects.all())
+            ])
+
+            class Meta:
+                model = Country._parler_meta.root_model
+                fields = ('name',)
+
+        class CountryUniqueNameSerializer(TranslatableModelSerializer):
+            translations = TranslatedFieldsField(serializer_class=UniqueNameSerializer, shared_model=Country)
+
+            class Meta:
+                model = Country
+                fields = ('country_code', 'translations')
+
+        translations = {'en': {'name': "Spain"}, 'es': {'name': "Spanje"}, 'fr': {'name': "España"}}
+        serializer = CountryUniqueNameSerializer(data={'country_code': 'FR', 'translations': translations})
+        # One query for the unique country_code, and a single query checks all languages.
+        with self.assertNumQueries(2):
+            self.assertFalse(serializer.is_valid())
+        self.assertCountEqual(serializer.errors['translations'], ('en', 'fr'))
+        self.assertEqual(serializer.errors['translations']['en']['name'][0].code, 'unique')
+
+        # Updating the object itself is no conflict, but using the name of another language is.
+        serializer = CountryUniqueNameSerializer(self.instance, data={'translations': translations}, partial=True)
+        self.assertFalse(serializer.is_valid())
+        self.assertCountEqual(serializer.errors['translations'], ('fr',))
+
+    def test_translations_validation_unique_other_model(self):
+        class CountryCodeSerializer(serializers.ModelSerializer):
+            country_code = serializers.CharField(validators=[UniqueValidator(queryset=Country.objects.all())])
+
+            class Meta:
+                model = Country._parler_meta.root_model
+                fields = ('name', 'country_code')
+
+        # Validators for other models can't be checked for all languages at once, these remain on the field.
+        field = TranslatedFieldsField(serializer_class=CountryCodeSerializer, shared_model=Country)
+        data = {'en': {'name': "Spain", 'country_code': 'ES'}, 'es': {'name': "España", 'country_code': 'FR'}}
+        with self.assertRaises(serializers.ValidationError) as cm:
+            field.run_validation(data)
+        self.assertCountEqual(cm.exception.detail, ('en',))
+        self.assertEqual(cm.exception.detail['en']['country_code'][0].code, 'unique')
+
     def test_translations_validation_empty(self):
         for empty_value in (None, {}, '', ):
             data = {
@@ -181,6 +743,261 @@ class CountryTranslatedSerializerTestCase(TestCase):
         self.assertEqual(instance.name, "Espagne")
         self.assertEqual(instance.url, "http://fr.wikipedia.org/wiki/Espagne")
 
+    def test_translations_saving_only_changes(self):
+        data = {
+            'country_code': 'ES',
+            'translations': {
+                'en': {'name': "Spain", 'url': "http://en.wikipedia.org/wiki/Spain"},
+                'es': {'name': "España", 'url': "http://es.wikipedia.org/wiki/Reino_de_España"},
+            }
+        }
+        instance = Country.objects.get(pk=self.instance.pk)
+        serializer = CountryTranslatedSerializer(instance, data=data)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        with CaptureQueriesContext(connection) as queries:
+            serializer.save()
+
+        # A single query reads both languages, and only the changed column of Spanish is written.
+        table = Country._parler_meta.root_model._meta.db_table
+        translation_queries = [query['sql'] for query in queries if table in query['sql']]
+        self.assertEqual(len(translation_queries), 2)
+        self.assertTrue(translation_queries[0].startswith('SELECT'))
+        self.assertTrue(translation_queries[1].startswith('UPDATE'))
+        self.assertIn('"url"', translation_queries[1])
+        self.assertNotIn('"name"', translation_queries[1])
+
+        instance = Country.objects.get(pk=self.instance.pk)
+        instance.set_current_language('es')
+        self.assertEqual(instance.url, "http://es.wikipedia.org/wiki/Reino_de_España")
+
+    def test_translations_saving_replace(self):
+        self.instance.set_current_language('fr')
+        self.instance.name = "Espagne"
+        self.instance.save()
+
+        # Read the French translation into the parler cache
+        Country.objects.language('fr').get(pk=self.instance.pk).name
+
+        data = {
+            'country_code': 'ES',
+            'translations': {
+                'en': {'name': "Kingdom of Spain", 'url': "http://en.wikipedia.org/wiki/Spain"},
+            }
+        }
+        serializer = CountryReplaceTranslatedSerializer(self.instance, data=data)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        with CaptureQueriesContext(connection) as queries:
+            serializer.save()
+
+        deletes = [query['sql'] for query in queries if query['sql'].startswith('DELETE')]
+        self.assertEqual(len(deletes), 1)
+        self.assertIn('NOT', deletes[0])
+        self.assertEqual(serializer.data['translations'], {
+            'en': {'name': "Kingdom of Spain", 'url': "http://en.wikipedia.org/wiki/Spain"},
+        })
+
+        instance = Country.objects.get(pk=self.instance.pk)
+        self.assertEqual(list(instance.get_available_languages()), ['en'])
+        self.assertFalse(instance.has_translation('fr'))
+
+    def test_translations_saving_replace_partial(self):
+        data = {'translations': {'fr': {'name': "Espagne"}}}
+        serializer = CountryReplaceTranslatedSerializer(self.instance, data=data, partial=True)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        serializer.save()
+
+        instance = Country.objects.get(pk=self.instance.pk)
+        self.assertEqual(sorted(instance.get_available_languages()), ['en', 'es', 'fr'])
+
+    def test_translations_saving_replace_empty(self):
+        class CountryReplaceEmptySerializer(TranslatableModelSerializer):
+            translations = TranslatedFieldsField(shared_model=Country, replace=True, allow_empty=True)
+
+            class Meta:
+                model = Country
+                fields = ('pk', 'country_code', 'translations')
+
+        data = {'country_code': 'ES', 'translations': {}}
+        serializer = CountryReplaceEmptySerializer(self.instance, data=data)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        serializer.save()
+        self.assertEqual(Country.objects.get(pk=self.instance.pk).translations.count(), 0)
+
+    def test_translations_saving_replace_relations(self):
+        # Translations that other models refer to are deleted with the regular delete, which cascades.
+        self.instance.set_current_language('fr')
+        self.instance.name = "Espagne"
+        self.instance.save()
+
+        data = {'country_code': 'ES', 'translations': {'en': {'name': "Kingdom of Spain"}}}
+        serializer = CountryReplaceTranslatedSerializer(self.instance, data=data)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        with mock.patch('parler_rest.utils._has_delete_relations', return_value=True), \
+                mock.patch.object(QuerySet, 'delete', autospec=True, side_effect=QuerySet.delete) as delete:
+            serializer.save()
+        self.assertEqual(delete.call_count, 1)
+
+        instance = Country.objects.get(pk=self.instance.pk)
+        self.assertEqual(list(instance.get_available_languages()), ['en'])
+
+    def test_translations_bulk_saving_on_update(self):
+        data = {
+            'country_code': 'ES',
+            'translations': {
+                'en': {'name': "Spain", 'url': "http://en.wikipedia.org/wiki/Spain"},
+                'es': {'name': "Hispania", 'url': "http://es.wikipedia.org/wiki/Hispania"},
+                'fr': {'name': "Espagne", 'url': "http://fr.wikipedia.org/wiki/Espagne"},
+                'de': {'name': "Spanien", 'url': "http://de.wikipedia.org/wiki/Spanien"},
+            }
+        }
+        saved = []
+
+        def receiver(sender, instance, created, **kwargs):
+            saved.append((instance.language_code, created))
+
+        post_translation_save.connect(receiver, sender=Country)
+        self.addCleanup(post_translation_save.disconnect, receiver, sender=Country)
+
+        serializer = CountryBulkTranslatedSerializer(self.instance, data=data)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        # Update country, select translations, bulk insert, bulk update + 2 savepoint queries
+        with self.assertNumQueries(6):
+            instance = serializer.save()
+
+        # The unchanged English translation is not saved
+        self.assertCountEqual(saved, [('es', False), ('fr', True), ('de', True)])
+        self.assertEqual(serializer.data['translations']['es']['name'], "Hispania")
+        instance = Country.objects.get(pk=instance.pk)
+        instance.set_current_language('es')
+        self.assertEqual(instance.name, "Hispania")
+        instance.set_current_language('de')
+        self.assertEqual(instance.name, "Spanien")
+        self.assertEqual(instance.translations.count(), 4)
+
+    def test_translations_bulk_saving_prefetched(self):
+        # The prefetched translations are not read again.
+        instance = CountryBulkTranslatedSerializer.setup_eager_loading(Country.objects.all()).get(pk=self.instance.pk)
+        data = {'country_code': 'ES', 'translations': {'es': {'name': "Hispania"}, 'fr': {'name': "Espagne"}}}
+        serializer = CountryBulkTranslatedSerializer(instance, data=data, partial=True)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        with CaptureQueriesContext(connection) as queries:
+            serializer.save()
+        self.assertFalse([query for query in queries if query['sql'].startswith('SELECT')])
+        self.assertEqual(Country.objects.get(pk=self.instance.pk).translations.count(), 3)
+
+    def test_translations_bulk_saving_without_returned_pks(self):
+        # Databases like MySQL don't return the primary keys of bulk inserted rows.
+        data = {'country_code': 'ES', 'translations': {'fr': {'name': "Espagne"}}}
+        serializer = CountryBulkTranslatedSerializer(self.instance, data=data, partial=True)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        bulk_create = QuerySet.bulk_create
+
+        def bulk_create_without_pks(queryset, objs, *args, **kwargs):
+            result = bulk_create(queryset, objs, *args, **kwargs)
+            for obj in objs:
+                obj.pk = None
+            return result
+
+        with mock.patch('parler_rest.utils.can_return_rows_from_bulk_insert', return_value=False), \
+                mock.patch.object(QuerySet, 'bulk_create', autospec=True, side_effect=bulk_create_without_pks):
+            instance = serializer.save()
+
+        translation = instance._translations_cache[Country._parler_meta.root_model]['fr']
+        self.assertIsNotNone(translation.pk)
+        instance.set_current_language('fr')
+        instance.name = "Royaume d'Espagne"
+        instance.save()
+        self.assertEqual(Country.objects.get(pk=self.instance.pk).translations.count(), 3)
+
+    def test_translations_saving_many(self):
+        data = [
+            {
+                'country_code': code,
+                'translations': {
+                    'en': {'name': "{0} (en)".format(code)},
+                    'es': {'name': "{0} (es)".format(code)},
+                }
+            }
+            for code in ('FR', 'DE', 'NL')
+        ]
+        serializer = CountryBulkTranslatedSerializer(data=data, many=True)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        if can_return_rows_from_bulk_insert(connection):
+            # Bulk insert countries, bulk insert translations + 2 savepoint queries
+            with self.assertNumQueries(4):
+                instances = serializer.save()
+        else:
+            # The objects are created one by one
+            instances = serializer.save()
+
+        self.assertEqual(len(instances), 3)
+        instance = Country.objects.get(country_code='DE')
+        instance.set_current_language('es')
+        self.assertEqual(instance.name, "DE (es)")
+        self.assertEqual(serializer.data[2]['translations']['en']['name'], "NL (en)")
+
+    def test_translations_saving_many_one_by_one(self):
+        data = [
+            {'country_code': code, 'translations': {'en': {'name': code}}}
+            for code in ('FR', 'DE')
+        ]
+        serializer = CountryBulkTranslatedSerializer(data=data, many=True)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        with mock.patch('parler_rest.serializers.can_return_rows_from_bulk_insert', return_value=False):
+            instances = serializer.save()
+
+        self.assertTrue(all(instance.pk for instance in instances))
+        self.assertEqual(Country.objects.get(country_code='DE').safe_translation_getter('name', language_code='en'), "DE")
+
+    def test_translations_saving_many_custom_create(self):
+        class CountryCustomCreateSerializer(CountryBulkTranslatedSerializer):
+            def create(self, validated_data):
+                validated_data['country_code'] = validated_data['country_code'].lower()
+                return super(CountryCustomCreateSerializer, self).create(validated_data)
+
+        data = [
+            {'country_code': code, 'translations': {'en': {'name': code}}}
+            for code in ('FR', 'DE')
+        ]
+        serializer = CountryCustomCreateSerializer(data=data, many=True)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        serializer.save()
+        self.assertEqual(
+            sorted(Country.objects.exclude(pk=self.instance.pk).values_list('country_code', flat=True)), ['de', 'fr']
+        )
+
+    def test_translations_saving_many_custom_save_translations(self):
+        calls = []
+
+        class CountryCustomSaveSerializer(CountryBulkTranslatedSerializer):
+            def save_translations(self, instance, translated_data):
+                calls.append(instance.country_code)
+                super(CountryCustomSaveSerializer, self).save_translations(instance, translated_data)
+
+        data = [{'country_code': code, 'translations': {'en': {'name': code}}} for code in ('FR', 'DE')]
+        serializer = CountryCustomSaveSerializer(data=data, many=True)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        serializer.save()
+        self.assertEqual(calls, ['FR', 'DE'])
+
+    def test_translations_saving_many_default(self):
+        # Without Meta.bulk_create, each object is saved as usual.
+        saved = []
+
+        def on_post_save(sender, instance, created, **kwargs):
+            saved.append(instance.country_code)
+
+        data = [{'country_code': code, 'translations': {'en': {'name': code}}} for code in ('FR', 'DE')]
+        serializer = CountryTranslatedSerializer(data=data, many=True)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        post_save.connect(on_post_save, sender=Country)
+        try:
+            serializer.save()
+        finally:
+            post_save.disconnect(on_post_save, sender=Country)
+        self.assertEqual(saved, ['FR', 'DE'])
+        self.assertEqual(Country.objects.get(country_code='DE').safe_translation_getter('name', language_code='en'), "DE")
+
     def test_deserialization_invalid_data_types(self):
         data = {"translations": "this is not a dict"}
         serializer = CountryTranslatedSerializer(self.instance, data=data, partial=True)
@@ -246,6 +1063,30 @@ class ParlerRestUtilsTestCase(unittest.TestCase):
         assert serializer.fields["url"]
         assert serializer.fields["language_code"]
 
+    def test_parler_meta_by_source(self):
+        meta_by_source = get_parler_meta_by_source(Country)
+        self.assertEqual(sorted(meta_by_source), ['name', 'translations', 'url'])
+        self.assertIs(meta_by_source['name'], Country._parler_meta.root)
+        self.assertIs(get_parler_meta_by_source(Country), meta_by_source)
+
+    def test_translation_serializer_class_cache(self):
+        serializer_class = create_translated_fields_serializer(Country, meta={'fields': ['name']})
+        assert create_translated_fields_serializer(Country, meta={'fields': ['name']}) is serializer_class
+        assert create_translated_fields_serializer(Country, meta={'fields': ['url']}) is not serializer_class
+
+        # Field instances can't be compared without side effects, e.g. the repr() of a queryset runs a query.
+        validator = UniqueValidator(queryset=Country._parler_meta.root_model.objects.all())
+        with mock.patch.object(QuerySet, '_fetch_all', side_effect=AssertionError("The queryset was evaluated")):
+            name_serializer_class = create_translated_fields_serializer(
+                Country, name=serializers.CharField(validators=[validator])
+            )
+        assert create_translated_fields_serializer(
+            Country, name=serializers.CharField(validators=[validator])
+        ) is not name_serializer_class
+
+        clear_translated_fields_serializer_cache()
+        assert create_translated_fields_serializer(Country, meta={'fields': ['name']}) is not serializer_class
+
 
 class PictureCaptionSerializerTestCase(TestCase):
 
@@ -273,6 +1114,43 @@ class PictureCaptionSerializerTestCase(TestCase):
         serializer = PictureCaptionSerializer(self.instance)
         self.assertCountEqual(serializer.data, expected)
 
+    def test_translation_serialization_values(self):
+        Picture.objects.create(image_nr=2, caption="France")
+        context = {'translation_values': True}
+        with self.assertNumQueries(2):
+            data = PictureCaptionSerializer(Picture.objects.order_by('pk'), many=True, context=context).data
+        self.assertEqual(data[0]['caption'], {'en': "Spain", 'es': "España"})
+        self.assertEqual(data[1]['caption'], {'en': "France"})
+
+    def test_fast_translations_serialization_method(self):
+        # DRF calls the method, so it can't be read as a plain attribute.
+        serializer = PictureShoutSerializer(self.instance)
+        self.assertIsNone(serializer.fields['translations'].plain_getter)
+        expected = {
+            translation.language_code: PictureShoutTranslationSerializer(translation).data
+            for translation in self.instance.translations.all()
+        }
+        self.assertEqual(serializer.data['translations'], expected)
+        self.assertEqual(expected['en'], {'caption': "Spain", 'shout': "Spain!"})
+
+        context = {'translation_values': True}
+        data = PictureShoutSerializer(Picture.objects.all(), many=True, context=context).data
+        self.assertEqual(data[0]['translations'], expected)
+
+    def test_translation_queries_per_row(self):
+        Picture.objects.create(image_nr=2, caption="Another picture")
+        with self.assertRaisesMessage(AssertionError, "caused by: caption"):
+            assert_translation_queries_constant(PictureCaptionSerializer, Picture.objects.all())
+
+    def test_translated_field_sources(self):
+        self.assertEqual(PictureCaptionSerializer.get_translated_field_sources(), {'caption': TranslatedField})
+        self.assertEqual(CountryExplicitTranslatedSerializer.get_translated_field_sources(), {
+            'translations': TranslatedFieldsField
+        })
+
+    def test_translated_related_names(self):
+        self.assertEqual(PictureCaptionSerializer.get_translated_related_names(), ['translations'])
+
     def test_translation_deserialization(self):
         data = {
             'image_nr': 2,
@@ -1 +1,11 @@
-urlpatterns = []
+from django.http import HttpResponse
+from django.urls import path
+
+
+def country_detail(request, pk, slug):
+    return HttpResponse(slug)
+
+
+urlpatterns = [
+    path('countries/<int:pk>/<slug:slug>/', country_detail, name='country-detail'),
+]